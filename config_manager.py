@@ -3,14 +3,63 @@
 Configuration Manager - Handles settings persistence
 """
 
+import copy
 import json
 import os
+import time
 import logging
 from pathlib import Path
 
 
 logger = logging.getLogger(__name__)
 
+# Existence checks keyed by path: (checked_at, exists)
+_exists_cache = {}
+EXISTS_TTL = 2.0
+
+
+def _paths_exist(paths):
+    """
+    Resolve existence of several paths, scanning a parent directory only
+    when more than one path lives in it
+    
+    Args:
+        paths: List of file paths
+        
+    Returns:
+        dict: Mapping of path to bool
+    """
+    now = time.monotonic()
+    result = {}
+    by_parent = {}
+    
+    for p in paths:
+        hit = _exists_cache.get(p)
+        if hit and now - hit[0] < EXISTS_TTL:
+            result[p] = hit[1]
+        else:
+            by_parent.setdefault(os.path.dirname(p) or ".", []).append(p)
+    
+    for parent, siblings in by_parent.items():
+        names = None
+        if len(siblings) > 1:
+            try:
+                with os.scandir(parent) as it:
+                    names = {entry.name for entry in it}
+            except OSError:
+                names = set()
+        for p in siblings:
+            # Fall back to a real stat when the name isn't listed verbatim,
+            # so case-insensitive or normalizing filesystems still match
+            if names is not None and os.path.basename(p) in names:
+                exists = True
+            else:
+                exists = os.path.exists(p)
+            _exists_cache[p] = (now, exists)
+            result[p] = exists
+    
+    return result
+
 
 class ConfigManager:
     """Manages application configuration and settings persistence"""
@@ -22,8 +71,13 @@ class ConfigManager:
         "last_output_dir": "./output",
         "default_clip_length": 10,
         "default_workers": 2,
-        "prefer_gpu": False,
+        "ffmpeg_threads": 0,
+        "encoder_preset": "speed",
+        "prefer_gpu": True,
         "use_audio_normalization": True,
+        "single_pass_render": False,
+        "batch_render": False,
+        "seek_proxy": False,
         "recent_files": {
             "backgrounds": [],
             "animations": [],
@@ -31,6 +85,9 @@ class ConfigManager:
         }
     }
     
+    # Parsed config files keyed by path: (mtime, config dict)
+    _cache = {}
+    
     def __init__(self, config_file="autocutter_config.json"):
         """
         Initialize configuration manager
@@ -39,6 +96,7 @@ class ConfigManager:
             config_file: Path to configuration file
         """
         self.config_file = config_file
+        self._dirty = False
         self.config = self.load_config()
     
     def load_config(self):
@@ -48,31 +106,46 @@ class ConfigManager:
         Returns:
             dict: Configuration dictionary
         """
-        if not os.path.exists(self.config_file):
+        try:
+            mtime = os.stat(self.config_file).st_mtime
+        except OSError:
             logger.info("Config file not found, using defaults")
-            return self.DEFAULT_CONFIG.copy()
+            return copy.deepcopy(self.DEFAULT_CONFIG)
+        
+        cached = self._cache.get(self.config_file)
+        if cached and cached[0] == mtime:
+            return copy.deepcopy(cached[1])
         
         try:
             with open(self.config_file, 'r', encoding='utf-8') as f:
                 loaded = json.load(f)
                 
             # Merge with defaults (in case new keys were added)
-            config = self.DEFAULT_CONFIG.copy()
+            config = copy.deepcopy(self.DEFAULT_CONFIG)
             config.update(loaded)
             
+            self._cache[self.config_file] = (mtime, copy.deepcopy(config))
             logger.info(f"Loaded config from {self.config_file}")
             return config
             
         except Exception as e:
             logger.error(f"Error loading config: {e}")
-            return self.DEFAULT_CONFIG.copy()
+            return copy.deepcopy(self.DEFAULT_CONFIG)
     
     def save_config(self):
-        """Save configuration to file"""
+        """Save configuration to file (no-op when nothing changed)"""
+        if not self._dirty:
+            return True
+        
         try:
             with open(self.config_file, 'w', encoding='utf-8') as f:
                 json.dump(self.config, f, indent=2, ensure_ascii=False)
             
+            self._dirty = False
+            self._cache[self.config_file] = (
+                os.stat(self.config_file).st_mtime,
+                copy.deepcopy(self.config)
+            )
             logger.info(f"Saved config to {self.config_file}")
             return True
             
@@ -101,7 +174,9 @@ class ConfigManager:
             key: Configuration key
             value: Value to set
         """
-        self.config[key] = value
+        if self.config.get(key) != value:
+            self.config[key] = value
+            self._dirty = True
     
     def add_recent_file(self, file_type, file_path):
         """
@@ -115,6 +190,8 @@ class ConfigManager:
             return
         
         recent = self.config["recent_files"][file_type]
+        if recent and recent[0] == file_path:
+            return
         
         # Remove if already exists
         if file_path in recent:
@@ -125,6 +202,7 @@ class ConfigManager:
         
         # Keep only last 10
         self.config["recent_files"][file_type] = recent[:10]
+        self._dirty = True
     
     def get_recent_files(self, file_type):
         """
@@ -138,7 +216,8 @@ class ConfigManager:
         """
         recent = self.config["recent_files"].get(file_type, [])
         # Filter out files that no longer exist
-        return [f for f in recent if os.path.exists(f)]
+        exists = _paths_exist(recent)
+        return [f for f in recent if exists[f]]
     
     def update_last_directory(self, file_type, directory):
         """
@@ -148,5 +227,4 @@ class ConfigManager:
             file_type: Type of file ('background', 'animation', 'music', 'output')
             directory: Directory path
         """
-        key = f"last_{file_type}_dir"
-        self.config[key] = directory
\ No newline at end of file
+        self.set(f"last_{file_type}_dir", directory)
\ No newline at end of file
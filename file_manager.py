@@ -4,9 +4,212 @@ File Manager Module - Handles file operations and media information
 """
 
 import os
+import json
+import stat
+import atexit
+import threading
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from shutil import which
-from pathlib import Path
+
+
+SIZE_UNITS = ("B", "KB", "MB", "GB", "TB", "PB")
+
+EMPTY_MEDIA_INFO = {
+    "duration": 0, "width": 0, "height": 0, "rotation": 0,
+    "codec": None, "audio_codec": None
+}
+
+
+def _stream_rotation(stream):
+    """
+    Get a video stream's display rotation from ffprobe output
+    
+    Args:
+        stream: Stream dict from ffprobe's JSON output
+        
+    Returns:
+        int: Clockwise rotation in degrees (0, 90, 180 or 270)
+    """
+    for side_data in stream.get("side_data_list", []):
+        if "rotation" in side_data:
+            # Display matrix rotation is counter-clockwise
+            return int(-float(side_data["rotation"])) % 360
+    try:
+        return int(stream.get("tags", {}).get("rotate", 0)) % 360
+    except ValueError:
+        return 0
+
+
+def _probe_media_info(file_path):
+    """
+    Run ffprobe once for a file
+    
+    Args:
+        file_path: Path to media file
+        
+    Returns:
+        dict: Media info (see FileManager.get_media_info)
+    """
+    info = dict(EMPTY_MEDIA_INFO)
+    try:
+        result = subprocess.run(
+            [
+                "ffprobe",
+                "-v", "error",
+                "-print_format", "json",
+                "-show_entries",
+                "format=duration:stream=codec_type,codec_name,width,height"
+                ":stream_tags=rotate:stream_side_data=rotation",
+                file_path
+            ],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            text=True,
+            check=False,
+            timeout=10
+        )
+        if result.returncode != 0 or not result.stdout.strip():
+            return info
+        
+        data = json.loads(result.stdout)
+        info["duration"] = float(data.get("format", {}).get("duration", 0))
+        for stream in data.get("streams", []):
+            if stream.get("codec_type") == "video" and info["codec"] is None:
+                info["width"] = int(stream.get("width", 0))
+                info["height"] = int(stream.get("height", 0))
+                info["codec"] = stream.get("codec_name")
+                info["rotation"] = _stream_rotation(stream)
+                # FFmpeg autorotates on decode, so report the displayed size
+                if info["rotation"] % 180 == 90:
+                    info["width"], info["height"] = info["height"], info["width"]
+            elif stream.get("codec_type") == "audio" and info["audio_codec"] is None:
+                info["audio_codec"] = stream.get("codec_name")
+    except Exception as e:
+        print(f"Error probing {file_path}: {e}")
+    
+    return info
+
+
+class MediaInfoCache:
+    """Persistent ffprobe results, validated by file mtime and size"""
+    
+    # Oldest entries are dropped beyond this, so the file stays small
+    MAX_ENTRIES = 512
+    
+    DEFAULT_FILE = os.path.join(
+        os.path.expanduser("~"), ".cache", "autocutter", "media.json"
+    )
+    
+    def __init__(self, cache_file=DEFAULT_FILE):
+        """
+        Initialize media info cache (loaded lazily on first lookup)
+        
+        Args:
+            cache_file: Path to the JSON cache file
+        """
+        self.cache_file = cache_file
+        self.entries = None
+        self._dirty = False
+        self._lock = threading.Lock()
+    
+    def _load(self):
+        """Load cached entries from disk"""
+        try:
+            with open(self.cache_file, 'r', encoding='utf-8') as f:
+                self.entries = json.load(f)
+        except (OSError, ValueError):
+            self.entries = {}
+    
+    def get(self, file_path, mtime, size):
+        """
+        Get cached media info
+        
+        Args:
+            file_path: Path to media file
+            mtime: Current modification time of the file (ns)
+            size: Current size of the file in bytes
+            
+        Returns:
+            dict: Media info, or None if missing or stale
+        """
+        with self._lock:
+            if self.entries is None:
+                self._load()
+            entry = self.entries.get(file_path)
+        
+        # Entries written before rotation was probed hold coded dimensions
+        if (entry and entry.get("mtime") == mtime and entry.get("size") == size
+                and "rotation" in entry["info"]):
+            return {**EMPTY_MEDIA_INFO, **entry["info"]}
+        return None
+    
+    def put(self, file_path, mtime, size, info):
+        """
+        Store media info for a file
+        
+        Args:
+            file_path: Path to media file
+            mtime: Modification time of the file (ns)
+            size: Size of the file in bytes
+            info: Media info dictionary
+        """
+        with self._lock:
+            if self.entries is None:
+                self._load()
+            # Re-inserting moves the path to the end (newest)
+            self.entries.pop(file_path, None)
+            self.entries[file_path] = {"mtime": mtime, "size": size, "info": dict(info)}
+            while len(self.entries) > self.MAX_ENTRIES:
+                del self.entries[next(iter(self.entries))]
+            self._dirty = True
+    
+    def save(self):
+        """Write the cache to disk if anything changed"""
+        with self._lock:
+            if not self._dirty:
+                return
+            try:
+                os.makedirs(os.path.dirname(self.cache_file), exist_ok=True)
+                with open(self.cache_file, 'w', encoding='utf-8') as f:
+                    json.dump(self.entries, f)
+                self._dirty = False
+            except Exception as e:
+                print(f"Error saving media cache: {e}")
+
+
+media_cache = MediaInfoCache()
+atexit.register(media_cache.save)
+
+
+class ProbeError(Exception):
+    """Raised when ffprobe could not read a file"""
+
+
+@lru_cache(maxsize=256)
+def _lookup_media_info(file_path, mtime_ns, size):
+    """
+    Get media info from the persistent cache, probing on a miss
+    
+    Failed probes raise instead of returning, so lru_cache does not keep
+    them and the file is retried on the next lookup.
+    
+    Args:
+        file_path: Path to media file
+        mtime_ns: Modification time of the file in nanoseconds
+        size: Size of the file in bytes
+        
+    Returns:
+        dict: Media info (see FileManager.get_media_info)
+    """
+    info = media_cache.get(file_path, mtime_ns, size)
+    if info is None:
+        info = _probe_media_info(file_path)
+        if info["duration"] <= 0:
+            raise ProbeError(file_path)
+        media_cache.put(file_path, mtime_ns, size, info)
+    return info
 
 
 class FileManager:
@@ -17,6 +220,49 @@ class FileManager:
         """Check if ffmpeg and ffprobe are available in PATH"""
         return which("ffmpeg") is not None and which("ffprobe") is not None
     
+    @staticmethod
+    def get_media_info(file_path):
+        """
+        Get duration, resolution and codecs with one ffprobe call
+        
+        Results are cached in memory and on disk by (path, mtime, size), so
+        lookups of an unchanged file skip ffprobe, including across sessions.
+        
+        Args:
+            file_path: Path to media file
+            
+        Returns:
+            dict: Keys 'duration', 'width', 'height' (as displayed),
+                  'rotation', 'codec' (video), 'audio_codec'
+                  (0 / None when unknown)
+        """
+        try:
+            st = os.stat(file_path)
+        except OSError:
+            return dict(EMPTY_MEDIA_INFO)
+        
+        try:
+            return dict(_lookup_media_info(file_path, st.st_mtime_ns, st.st_size))
+        except ProbeError:
+            return dict(EMPTY_MEDIA_INFO)
+    
+    @staticmethod
+    def get_cached_media_info(file_path):
+        """
+        Get media info only if it is already cached (never runs ffprobe)
+        
+        Args:
+            file_path: Path to media file
+            
+        Returns:
+            dict: Media info, or None if not cached
+        """
+        try:
+            st = os.stat(file_path)
+        except OSError:
+            return None
+        return media_cache.get(file_path, st.st_mtime_ns, st.st_size)
+    
     @staticmethod
     def get_media_duration(file_path):
         """
@@ -28,27 +274,29 @@ class FileManager:
         Returns:
             float: Duration in seconds, or 0 if error
         """
-        try:
-            result = subprocess.run(
-                [
-                    "ffprobe",
-                    "-v", "error",
-                    "-show_entries", "format=duration",
-                    "-of", "csv=p=0",
-                    file_path
-                ],
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                text=True,
-                check=False,
-                timeout=10
-            )
-            if result.returncode == 0 and result.stdout.strip():
-                return float(result.stdout.strip())
-            return 0
-        except Exception as e:
-            print(f"Error getting duration for {file_path}: {e}")
-            return 0
+        return FileManager.get_media_info(file_path)["duration"]
+    
+    @staticmethod
+    def get_media_durations_bulk(paths):
+        """
+        Get durations of several media files concurrently
+        
+        ffprobe is latency-bound on process startup, so the probes run in
+        threads rather than one after another.
+        
+        Args:
+            paths: Iterable of media file paths
+            
+        Returns:
+            dict: Mapping of path to duration in seconds (0 if error)
+        """
+        paths = list(dict.fromkeys(paths))
+        if not paths:
+            return {}
+        
+        with ThreadPoolExecutor(max_workers=min(32, len(paths))) as executor:
+            durations = executor.map(FileManager.get_media_duration, paths)
+            return dict(zip(paths, durations))
     
     @staticmethod
     def get_video_resolution(file_path):
@@ -61,29 +309,8 @@ class FileManager:
         Returns:
             tuple: (width, height) or (0, 0) if error
         """
-        try:
-            result = subprocess.run(
-                [
-                    "ffprobe",
-                    "-v", "error",
-                    "-select_streams", "v:0",
-                    "-show_entries", "stream=width,height",
-                    "-of", "csv=p=0",
-                    file_path
-                ],
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                text=True,
-                check=False,
-                timeout=10
-            )
-            if result.returncode == 0 and result.stdout.strip():
-                parts = result.stdout.strip().split(',')
-                if len(parts) == 2:
-                    return int(parts[0]), int(parts[1])
-            return 0, 0
-        except Exception:
-            return 0, 0
+        info = FileManager.get_media_info(file_path)
+        return info["width"], info["height"]
     
     @staticmethod
     def ensure_directory(path):
@@ -145,8 +372,11 @@ class FileManager:
         if not file_path:
             return False
         
-        path = Path(file_path)
-        return path.exists() and path.is_file() and os.access(file_path, os.R_OK)
+        try:
+            st = os.stat(file_path)
+        except OSError:
+            return False
+        return stat.S_ISREG(st.st_mode) and os.access(file_path, os.R_OK)
     
     @staticmethod
     def get_file_size(file_path):
@@ -175,8 +405,9 @@ class FileManager:
         Returns:
             str: Formatted size (e.g., "1.5 MB")
         """
-        for unit in ['B', 'KB', 'MB', 'GB', 'TB']:
-            if bytes_size < 1024.0:
-                return f"{bytes_size:.1f} {unit}"
-            bytes_size /= 1024.0
-        return f"{bytes_size:.1f} PB"
\ No newline at end of file
+        if bytes_size < 1024:
+            return f"{bytes_size:.1f} B"
+        
+        # Each unit is 2**10 larger, so the unit index is bit_length // 10
+        index = min((int(bytes_size).bit_length() - 1) // 10, len(SIZE_UNITS) - 1)
+        return f"{bytes_size / (1 << (index * 10)):.1f} {SIZE_UNITS[index]}"
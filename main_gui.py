@@ -6,93 +6,246 @@ Requires: PySide6
 
 import os
 import sys
+import time
 import logging
-from concurrent.futures import ProcessPoolExecutor, as_completed
+import threading
+from functools import partial
+from concurrent.futures import (
+    ThreadPoolExecutor, FIRST_COMPLETED, wait
+)
 
 from PySide6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
     QPushButton, QLabel, QFileDialog, QSpinBox, QProgressBar,
     QGroupBox, QMessageBox, QCheckBox, QDoubleSpinBox,
-    QSlider, QSizePolicy, QFrame
+    QSlider, QSizePolicy, QFrame, QComboBox
+)
+from PySide6.QtCore import (
+    Qt, QThread, Signal, QUrl, QTimer, QObject, QRunnable, QThreadPool
 )
-from PySide6.QtCore import Qt, QThread, Signal, QUrl
-from PySide6.QtMultimedia import QMediaPlayer, QAudioOutput
 from PySide6.QtGui import QFont
 
 # Import our modules
 from file_manager import FileManager
-from renderer import FFmpegRenderer, RenderSession
+from renderer import (
+    FFmpegRenderer, RenderSession, available_cpus, OUTPUT_WIDTH, OUTPUT_HEIGHT
+)
 from config_manager import ConfigManager
 
 
-# Setup logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler('autocutter.log'),
-        logging.StreamHandler()
-    ]
-)
 logger = logging.getLogger(__name__)
 
+# Upper bound on clips fused into one FFmpeg process by the worker pool
+CLIPS_PER_BATCH = 8
+
+# Hard cap on concurrent FFmpeg processes
+MAX_RENDER_WORKERS = 64
+
+# Concurrent NVENC sessions allowed on consumer GeForce cards (older
+# drivers); extra sessions fail to open rather than queue
+NVENC_MAX_SESSIONS = 3
+
+# Minimum seconds between progress signals from the render thread
+PROGRESS_INTERVAL = 0.1
+
+# Fewer background seeks than this do not pay for transcoding a seek proxy
+SEEK_PROXY_MIN_SEEKS = 4
+
+
+def setup_logging():
+    """
+    Configure application logging
+    
+    Called from main() rather than at import time, so importing this
+    module does not open the log file.
+    force=True replaces the console-only setup done by the renderer import.
+    """
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(levelname)s - %(message)s',
+        handlers=[
+            logging.FileHandler('autocutter.log'),
+            logging.StreamHandler()
+        ],
+        force=True
+    )
+
+
+def map_as_completed(executor, fn, tasks, window, stop_requested=None):
+    """
+    Like executor.map, but unordered and with at most `window` tasks in flight
+    
+    Tasks are submitted lazily as earlier ones finish, so a long queue
+    does not hold every pending task and future in memory at once, and
+    stopping only has to drop the window rather than the whole backlog.
+    Results come back as soon as they complete, so one slow task never
+    holds up the rest of the window.
+    
+    Args:
+        executor: Executor to submit to
+        fn: Callable run for each task
+        tasks: Iterable of argument tuples
+        window: Maximum number of pending futures
+        stop_requested: Optional callable; when it returns True no further
+                        tasks are submitted and pending ones are cancelled
+        
+    Yields:
+        tuple: (task index, result of fn), in completion order
+    """
+    tasks = enumerate(tasks)
+    pending = {}
+    
+    def fill():
+        while len(pending) < window:
+            if stop_requested and stop_requested():
+                return
+            index, task = next(tasks, (None, None))
+            if task is None:
+                return
+            pending[executor.submit(fn, *task)] = index
+    
+    try:
+        fill()
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                yield pending.pop(future), future.result()
+            fill()
+    finally:
+        for future in pending:
+            future.cancel()
+
+
+# Styles shared by repeated widgets, parsed once for the whole application.
+# Widgets opt in via object names; state changes flip dynamic properties.
+APP_STYLESHEET = """
+    QGroupBox { font-weight: bold; }
+    QLabel#pickerTitle { font-weight: bold; font-size: 11px; }
+    QLabel#pickerPath {
+        color: #666; padding: 8px; background: #f5f5f5;
+        border: 1px solid #ddd; border-radius: 4px; font-size: 10px;
+    }
+    QLabel#pickerPath[loaded="true"] {
+        color: #2e7d32; background: #e8f5e9; border: 1px solid #4caf50;
+    }
+    QLabel#pickerDuration { font-size: 10px; color: #888; }
+    QPushButton#browseButton {
+        background: #2196F3;
+        color: white;
+        border: none;
+        padding: 8px;
+        border-radius: 4px;
+        font-weight: bold;
+    }
+    QPushButton#browseButton:hover { background: #1976D2; }
+    QLabel#musicEndLabel { color: #4CAF50; }
+    QLabel#musicEndLabel[exceeds="true"] { color: #f44336; font-weight: bold; }
+"""
+
+
+def set_style_state(widget, name, value):
+    """Set a dynamic property used by APP_STYLESHEET, repolishing on change"""
+    if widget.property(name) == value:
+        return
+    widget.setProperty(name, value)
+    widget.style().unpolish(widget)
+    widget.style().polish(widget)
+
+
+class ProbeSignals(QObject):
+    """Signals for MediaProbeTask (QRunnable cannot emit itself)"""
+    finished = Signal(str, object)  # file path, media info dict
+
+
+class MediaProbeTask(QRunnable):
+    """Run ffprobe for one file on the global thread pool"""
+    
+    def __init__(self, file_path):
+        super().__init__()
+        self.file_path = file_path
+        self.signals = ProbeSignals()
+    
+    def run(self):
+        info = FileManager.get_media_info(self.file_path)
+        self.signals.finished.emit(self.file_path, info)
+
+
+class MediaPrefetchTask(QRunnable):
+    """Warm the media info cache for several files in one background task"""
+    
+    def __init__(self, file_paths):
+        super().__init__()
+        self.file_paths = file_paths
+    
+    def run(self):
+        FileManager.get_media_durations_bulk(self.file_paths)
+
 
 class CompactFilePicker(QWidget):
     """Compact file picker widget"""
     file_selected = Signal(str)
+    duration_changed = Signal(float)
+    
+    # How long to wait for Qt's duration before falling back to ffprobe
+    PROBE_FALLBACK_MS = 500
     
-    def __init__(self, label_text, file_filter, parent=None):
+    DIALOG_OPTIONS = (
+        QFileDialog.DontUseCustomDirectoryIcons | QFileDialog.DontResolveSymlinks
+    )
+    
+    def __init__(self, label_text, file_filter, parent=None, probe_details=False):
         super().__init__(parent)
+        # probe_details: always fetch codec/size in the background, not
+        # just the duration
+        self.probe_details = probe_details
+        self.probing_path = None
         self.file_path = None
         self.duration = 0
+        self.media_info = {}
         self.file_filter = file_filter
         self.label_text = label_text
         
+        # Hidden player (created on first use): Qt reads the duration from
+        # the container without spawning ffprobe
+        self.probe_player = None
+        self.probe_timer = QTimer(self)
+        self.probe_timer.setSingleShot(True)
+        self.probe_timer.setInterval(self.PROBE_FALLBACK_MS)
+        self.probe_timer.timeout.connect(self.probe_with_ffprobe)
+        
         layout = QVBoxLayout(self)
         layout.setContentsMargins(5, 5, 5, 5)
         layout.setSpacing(5)
         
         # Title
         title = QLabel(label_text)
-        title.setStyleSheet("font-weight: bold; font-size: 11px;")
+        title.setObjectName("pickerTitle")
         layout.addWidget(title)
         
         # File display
         self.path_label = QLabel("No file")
-        self.path_label.setStyleSheet(
-            "color: #666; padding: 8px; background: #f5f5f5; "
-            "border: 1px solid #ddd; border-radius: 4px; font-size: 10px;"
-        )
+        self.path_label.setObjectName("pickerPath")
         self.path_label.setWordWrap(True)
         self.path_label.setMaximumHeight(50)
         layout.addWidget(self.path_label)
         
         # Duration
         self.duration_label = QLabel("--")
-        self.duration_label.setStyleSheet("font-size: 10px; color: #888;")
+        self.duration_label.setObjectName("pickerDuration")
         layout.addWidget(self.duration_label)
         
         # Browse button
         self.browse_btn = QPushButton("📁 Browse")
-        self.browse_btn.setStyleSheet("""
-            QPushButton {
-                background: #2196F3;
-                color: white;
-                border: none;
-                padding: 8px;
-                border-radius: 4px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background: #1976D2;
-            }
-        """)
+        self.browse_btn.setObjectName("browseButton")
         self.browse_btn.clicked.connect(self.pick_file)
         layout.addWidget(self.browse_btn)
     
     def pick_file(self):
+        # Skip per-file icon lookups and symlink resolution, which dominate
+        # listing time on network mounts and very large folders
         file_path, _ = QFileDialog.getOpenFileName(
-            self, f"Select {self.label_text}", "", self.file_filter
+            self, f"Select {self.label_text}", "", self.file_filter,
+            options=self.DIALOG_OPTIONS
         )
         if file_path:
             self.set_file(file_path)
@@ -103,13 +256,54 @@ class CompactFilePicker(QWidget):
         filename = os.path.basename(file_path)
         self.path_label.setText(filename)
         self.path_label.setToolTip(file_path)
-        self.path_label.setStyleSheet(
-            "color: #2e7d32; padding: 8px; background: #e8f5e9; "
-            "border: 1px solid #4caf50; border-radius: 4px; font-size: 10px;"
-        )
+        set_style_state(self.path_label, "loaded", True)
         
-        # Get duration
-        self.duration = FileManager.get_media_duration(file_path)
+        # Known files are answered from the media cache; otherwise ask Qt
+        # and only fall back to ffprobe if it stays silent
+        self.media_info = FileManager.get_cached_media_info(file_path) or {}
+        if self.media_info:
+            self.set_duration(self.media_info["duration"])
+        else:
+            self.duration = 0
+            self.duration_label.setText("Duration: probing…")
+            if self.probe_player is None:
+                # QtMultimedia loads its backend on import; defer it until needed
+                from PySide6.QtMultimedia import QMediaPlayer
+                self.probe_player = QMediaPlayer(self)
+                self.probe_player.durationChanged.connect(self.on_probe_duration)
+            self.probe_player.setSource(QUrl.fromLocalFile(file_path))
+            self.probe_timer.start()
+            if self.probe_details:
+                self.probe_with_ffprobe()
+    
+    def on_probe_duration(self, duration_ms):
+        if duration_ms > 0 and self.probe_timer.isActive():
+            self.probe_timer.stop()
+            self.set_duration(duration_ms / 1000.0)
+    
+    def probe_with_ffprobe(self):
+        """Start ffprobe on the thread pool (once per selected file)"""
+        if not self.file_path or self.probing_path == self.file_path:
+            return
+        self.probing_path = self.file_path
+        task = MediaProbeTask(self.file_path)
+        task.signals.finished.connect(self.on_media_info)
+        QThreadPool.globalInstance().start(task)
+    
+    def on_media_info(self, file_path, info):
+        if file_path == self.probing_path:
+            self.probing_path = None
+        if file_path != self.file_path:
+            return  # Another file was picked meanwhile
+        
+        self.media_info = info
+        # Only report the duration if Qt has not already done so
+        if self.probe_timer.isActive() or self.duration <= 0:
+            self.probe_timer.stop()
+            self.set_duration(info["duration"])
+    
+    def set_duration(self, duration):
+        self.duration = duration
         if self.duration > 0:
             self.duration_label.setText(
                 f"Duration: {FileManager.format_duration(self.duration)} "
@@ -117,6 +311,7 @@ class CompactFilePicker(QWidget):
             )
         else:
             self.duration_label.setText("Duration: Unknown")
+        self.duration_changed.emit(self.duration)
 
 
 class MusicPlayerWidget(QWidget):
@@ -128,19 +323,16 @@ class MusicPlayerWidget(QWidget):
         self.music_duration = 0
         self.is_playing = False
         self.slider_pressed = False
+        self.label_second = -1  # Whole second currently shown in time_label
+        self.total_time = "0:00"  # Track length as shown in time_label
         
         layout = QVBoxLayout(self)
         layout.setContentsMargins(0, 0, 0, 0)
         layout.setSpacing(8)
         
-        # Media player
-        self.player = QMediaPlayer()
-        self.audio_output = QAudioOutput()
-        self.player.setAudioOutput(self.audio_output)
-        self.audio_output.setVolume(0.5)
-        
-        self.player.positionChanged.connect(self.on_position_changed)
-        self.player.durationChanged.connect(self.on_duration_changed)
+        # Media player, created when music is first loaded
+        self.player = None
+        self.audio_output = None
         
         # Timeline
         timeline_layout = QHBoxLayout()
@@ -149,9 +341,16 @@ class MusicPlayerWidget(QWidget):
         self.timeline_slider = QSlider(Qt.Horizontal)
         self.timeline_slider.setRange(0, 1000)
         self.timeline_slider.setValue(0)
-        self.timeline_slider.sliderPressed.connect(lambda: setattr(self, 'slider_pressed', True))
-        self.timeline_slider.sliderReleased.connect(self.on_slider_released)
-        self.timeline_slider.sliderMoved.connect(self.on_slider_moved)
+        # Slider and widget live on the GUI thread: connect directly
+        self.timeline_slider.sliderPressed.connect(
+            self.on_slider_pressed, Qt.DirectConnection
+        )
+        self.timeline_slider.sliderReleased.connect(
+            self.on_slider_released, Qt.DirectConnection
+        )
+        self.timeline_slider.sliderMoved.connect(
+            self.on_slider_moved, Qt.DirectConnection
+        )
         timeline_layout.addWidget(self.timeline_slider, stretch=1)
         layout.addLayout(timeline_layout)
         
@@ -217,7 +416,21 @@ class MusicPlayerWidget(QWidget):
         
         layout.addLayout(controls_layout)
     
+    def create_player(self):
+        """Create the media player (loads the QtMultimedia backend)"""
+        from PySide6.QtMultimedia import QMediaPlayer, QAudioOutput
+        
+        self.player = QMediaPlayer()
+        self.audio_output = QAudioOutput()
+        self.player.setAudioOutput(self.audio_output)
+        self.audio_output.setVolume(0.5)
+        
+        self.player.positionChanged.connect(self.on_position_changed)
+        self.player.durationChanged.connect(self.on_duration_changed)
+    
     def load_music(self, file_path):
+        if self.player is None:
+            self.create_player()
         self.player.setSource(QUrl.fromLocalFile(file_path))
         self.play_button.setEnabled(True)
         self.stop_button.setEnabled(True)
@@ -234,7 +447,8 @@ class MusicPlayerWidget(QWidget):
             self.is_playing = True
     
     def stop(self):
-        self.player.stop()
+        if self.player is not None:
+            self.player.stop()
         self.play_button.setText("▶")
         self.is_playing = False
         self.timeline_slider.setValue(0)
@@ -242,27 +456,34 @@ class MusicPlayerWidget(QWidget):
     def on_position_changed(self, position):
         if not self.slider_pressed and self.music_duration > 0:
             value = int((position / self.music_duration) * 1000)
-            self.timeline_slider.setValue(value)
+            if value != self.timeline_slider.value():
+                self.timeline_slider.setValue(value)
         
-        current = position / 1000.0
-        total = self.music_duration / 1000.0
-        self.time_label.setText(
-            f"{int(current//60)}:{int(current%60):02d} / "
-            f"{int(total//60)}:{int(total%60):02d}"
-        )
+        self.show_time(position)
+    
+    def show_time(self, position):
+        """Show a position (ms) against the track length in the time label"""
+        # The label only shows whole seconds, so most ticks and slider
+        # moves change nothing; a hidden label catches up on the next update
+        second = int(position // 1000)
+        if second == self.label_second or not self.time_label.isVisible():
+            return
+        self.label_second = second
+        
+        self.time_label.setText(f"{second // 60}:{second % 60:02d} / {self.total_time}")
     
     def on_duration_changed(self, duration):
         self.music_duration = duration
+        total = duration // 1000
+        self.total_time = f"{total // 60}:{total % 60:02d}"
+        self.label_second = -1
     
     def on_slider_moved(self, value):
         if self.music_duration > 0:
-            position = (value / 1000.0) * self.music_duration
-            current = position / 1000.0
-            total = self.music_duration / 1000.0
-            self.time_label.setText(
-                f"{int(current//60)}:{int(current%60):02d} / "
-                f"{int(total//60)}:{int(total%60):02d}"
-            )
+            self.show_time((value / 1000.0) * self.music_duration)
+    
+    def on_slider_pressed(self):
+        self.slider_pressed = True
     
     def on_slider_released(self):
         self.slider_pressed = False
@@ -281,84 +502,384 @@ class MusicPlayerWidget(QWidget):
         return 0
 
 
+def create_render_pool(workers):
+    """
+    Create a thread pool for clip rendering
+    
+    Each task only drives an FFmpeg subprocess and waits on its output,
+    so threads give the same parallelism as worker processes without
+    interpreter startup, re-imports or pickling of task arguments.
+    
+    Args:
+        workers: Number of concurrent FFmpeg processes
+        
+    Returns:
+        ThreadPoolExecutor
+    """
+    return ThreadPoolExecutor(
+        max_workers=workers, thread_name_prefix="render"
+    )
+
+
+def render_pool_size(workers, ffmpeg_threads, codec="libx264"):
+    """
+    Number of FFmpeg processes to run at once
+    
+    With an explicit per-process thread count, the pool is narrowed so
+    processes x threads stays within the usable CPUs; with automatic
+    threads the CPUs are divided among the workers instead. NVENC is
+    further limited by the concurrent sessions consumer GPUs allow.
+    
+    Args:
+        workers: Requested worker count
+        ffmpeg_threads: Threads per FFmpeg process (0 = automatic)
+        codec: Video codec the processes encode with
+        
+    Returns:
+        int: Pool size, clamped to [1, MAX_RENDER_WORKERS]
+    """
+    if ffmpeg_threads:
+        workers = min(workers, available_cpus() // ffmpeg_threads)
+    if codec == "h264_nvenc":
+        workers = min(workers, NVENC_MAX_SESSIONS)
+    return max(1, min(workers, MAX_RENDER_WORKERS))
+
+
 class RenderWorker(QThread):
     """Background rendering thread"""
     progress = Signal(int, str)
-    finished = Signal(str, list)
+    finished = Signal(str, int, int)  # message, successful clips, total clips
     error = Signal(str)
     
-    def __init__(self, settings):
+    def __init__(self, settings, pool=None):
         super().__init__()
         self.settings = settings
+        self.pool = pool
+        # Highest percentage reported from in-flight encodes; the lock keeps
+        # pool-thread and completion emits in order
+        self.encoded_percent = 0
+        self.progress_lock = threading.Lock()
     
     def run(self):
         try:
             # Create session
             session = RenderSession(self.settings['output_dir'])
-            
-            # Build tasks
-            tasks = []
             num_clips = self.settings['num_clips']
-            clip_length = self.settings['clip_length']
             
-            for i in range(num_clips):
-                output_path = session.generate_clip_filename(i, clip_length)
-                tasks.append((
-                    i,
-                    clip_length,
-                    self.settings['animation_video'],
-                    self.settings['background_video'],
-                    self.settings['music_file'],
-                    self.settings['music_start'],
-                    output_path,
-                    self.settings['codec'],
-                    self.settings['normalize_audio'],
-                    session.log_dir,
-                ))
-            
-            # Render in parallel
-            results = []
-            completed = 0
-            workers = self.settings['workers']
-            
-            with ProcessPoolExecutor(max_workers=workers) as executor:
-                futures = {
-                    executor.submit(
-                        FFmpegRenderer.render_clip,
-                        *task
-                    ): task for task in tasks
-                }
-                
-                for future in as_completed(futures):
+            # Summary is written incrementally as clips finish
+            session.start_summary(self.settings)
+            music_path = self.prepare_normalized_music(session)
+            try:
+                if self.settings.get('single_pass'):
+                    self.render_single_pass(session)
+                else:
+                    self.render_parallel(session)
+            finally:
+                session.finish_summary()
+                if music_path:
                     try:
-                        success, msg = future.result()
-                        results.append(msg)
-                        completed += 1
-                        progress = int((completed / len(tasks)) * 100)
-                        self.progress.emit(progress, msg)
-                    except Exception as e:
-                        results.append(f"❌ Exception: {e}")
-                        completed += 1
-                        progress = int((completed / len(tasks)) * 100)
-                        self.progress.emit(progress, f"❌ Error")
-            
-            # Write summary
-            session.write_summary(self.settings, results)
+                        os.remove(music_path)
+                    except OSError as e:
+                        logger.warning(f"Could not remove normalized music: {e}")
             
-            success_count = sum(1 for r in results if r.startswith("✅"))
             final_msg = (
-                f"Completed: {success_count}/{len(tasks)} clips rendered successfully!\n\n"
+                f"Completed: {session.success_count}/{num_clips} clips rendered successfully!\n\n"
                 f"Output folder: {session.session_dir}"
             )
             
-            self.finished.emit(final_msg, results)
+            # Per-clip results are in summary.txt; only counts cross threads
+            self.finished.emit(final_msg, session.success_count, num_clips)
             
         except Exception as e:
             logger.error(f"Rendering error: {e}", exc_info=True)
             self.error.emit(str(e))
+    
+    def render_single_pass(self, session):
+        """Render every clip with one FFmpeg process"""
+        num_clips = self.settings['num_clips']
+        status = f"Rendering {num_clips} clips in a single pass..."
+        self.progress.emit(0, status)
+        
+        total_length = num_clips * self.settings['clip_length']
+        last_percent = [0]
+        
+        def on_encoded(seconds):
+            percent = min(99, int(seconds / total_length * 100))
+            if percent > last_percent[0]:
+                last_percent[0] = percent
+                self.progress.emit(percent, status)
+        
+        outcomes = FFmpegRenderer.render_batch(
+            num_clips,
+            self.settings['clip_length'],
+            self.settings['animation_video'],
+            self.settings['background_video'],
+            self.settings['music_file'],
+            self.settings['music_start'],
+            session.generate_clip_pattern(self.settings['clip_length']),
+            self.settings['codec'],
+            self.settings['normalize_audio'],
+            session.log_dir,
+            self.settings['hw_filters'],
+            threads=self.settings.get('ffmpeg_threads', 0),
+            preset=self.settings['encoder_preset'],
+            bg_decode_args=self.settings['bg_decode_args'],
+            bg_size=self.settings['bg_size'],
+            progress_callback=on_encoded,
+        )
+        
+        for success, msg in outcomes:
+            session.record_result(success, msg)
+        self.progress.emit(100, outcomes[-1][1])
+    
+    def prepare_normalized_music(self, session):
+        """
+        Normalize the shared music segment once instead of in every clip
+        
+        Args:
+            session: Current RenderSession
+            
+        Returns:
+            str: Normalized WAV path to delete afterwards, or None if not used
+        """
+        if not self.settings['normalize_audio']:
+            return None
+        
+        self.progress.emit(0, "Normalizing music...")
+        music_path = os.path.join(session.session_dir, "music_normalized.wav")
+        if not FFmpegRenderer.normalize_music_segment(
+            self.settings['music_file'],
+            self.settings['music_start'],
+            self.settings['clip_length'],
+            music_path,
+            session.log_dir,
+        ):
+            return None
+        
+        # Clips now take the pre-normalized segment from its start as-is
+        self.settings = {
+            **self.settings,
+            'music_file': music_path,
+            'music_start': 0,
+            'normalize_audio': False,
+        }
+        return music_path
+    
+    def prepare_seek_proxy(self, session, num_seeks):
+        """
+        Swap the background for an all-intra proxy if enabled and worthwhile
+        
+        Args:
+            session: Current RenderSession
+            num_seeks: Number of FFmpeg processes that will seek the background
+            
+        Returns:
+            str: Proxy path to delete afterwards, or None if not used
+        """
+        if not self.settings.get('seek_proxy') or num_seeks < SEEK_PROXY_MIN_SEEKS:
+            return None
+        
+        self.progress.emit(0, "Creating seek proxy...")
+        proxy_path = os.path.join(session.session_dir, "bg_proxy.mp4")
+        if not FFmpegRenderer.create_seek_proxy(
+            self.settings['background_video'],
+            proxy_path,
+            self.settings['num_clips'] * self.settings['clip_length'],
+            session.log_dir,
+        ):
+            return None
+        
+        # The proxy is already cropped H.264, so GPU decode args no longer apply
+        self.settings = {
+            **self.settings,
+            'background_video': proxy_path,
+            'bg_decode_args': None,
+            'bg_size': (OUTPUT_WIDTH, OUTPUT_HEIGHT),
+        }
+        return proxy_path
+    
+    def render_parallel(self, session):
+        """Render clips across a worker pool, in small fused batches if enabled"""
+        num_clips = self.settings['num_clips']
+        workers = self.settings['workers']
+        
+        # Batches cut at keyframes and concat packet edges, so clip edges can
+        # shift slightly against per-clip -ss/-t renders; they are opt-in.
+        # Batch only as far as it still keeps every worker busy
+        batch_size = 1
+        if self.settings.get('batch_render'):
+            batch_size = min(CLIPS_PER_BATCH, -(-num_clips // workers))
+        
+        proxy_path = self.prepare_seek_proxy(session, -(-num_clips // batch_size))
+        try:
+            if num_clips == 1 or workers == 1:
+                # One FFmpeg process at a time runs straight on this thread
+                return self.collect_parallel(None, session, batch_size)
+            if self.pool is None:
+                # No shared pool supplied: use a private one for this session
+                with create_render_pool(workers) as executor:
+                    return self.collect_parallel(executor, session, batch_size)
+            return self.collect_parallel(self.pool, session, batch_size)
+        finally:
+            if proxy_path:
+                try:
+                    os.remove(proxy_path)
+                except OSError as e:
+                    logger.warning(f"Could not remove seek proxy: {e}")
+    
+    def collect_parallel(self, executor, session, batch_size):
+        """Run work on the pool (inline if executor is None), recording results"""
+        num_clips = self.settings['num_clips']
+        clip_length = self.settings['clip_length']
+        done = set()
+        
+        try:
+            if batch_size > 1:
+                outcomes = self.submit_batches(executor, session, batch_size)
+            else:
+                outcomes = self.submit_clips(executor, session)
+            
+            # Batches finish in bursts; emit at most once per interval
+            # (plus the final clip) so the GUI queue is not flooded
+            next_emit = 0
+            for index, success, msg in outcomes:
+                done.add(index)
+                session.record_result(success, msg)
+                now = time.monotonic()
+                if now >= next_emit or len(done) == num_clips:
+                    next_emit = now + PROGRESS_INTERVAL
+                    progress = int((len(done) / num_clips) * 100)
+                    with self.progress_lock:
+                        progress = max(progress, self.encoded_percent)
+                        self.encoded_percent = progress
+                        self.progress.emit(progress, msg)
+        except Exception as e:
+            logger.error(f"Worker pool error: {e}", exc_info=True)
+            for i in range(num_clips):
+                if i in done:
+                    continue
+                clip_path = session.generate_clip_filename(i, clip_length)
+                msg = f"❌ {os.path.basename(clip_path)} (error: {e})"
+                session.record_result(False, msg)
+            self.progress.emit(100, f"❌ Error")
+    
+    def map_window(self, executor, fn, tasks):
+        """Run tasks with two per worker in flight, stopping on interruption"""
+        if executor is None:
+            return self.map_inline(fn, tasks)
+        return map_as_completed(
+            executor, fn, tasks, self.settings['workers'] * 2,
+            self.isInterruptionRequested
+        )
+    
+    def map_inline(self, fn, tasks):
+        """Run tasks one after another on this thread, in map_window's format"""
+        for index, task in enumerate(tasks):
+            if self.isInterruptionRequested():
+                return
+            yield index, fn(*task)
+    
+    def threads_per_process(self):
+        """FFmpeg threads per worker so the pool does not oversubscribe CPUs"""
+        if self.settings.get('ffmpeg_threads'):
+            return self.settings['ffmpeg_threads']
+        return max(1, available_cpus() // self.settings['workers'])
+    
+    def submit_clips(self, executor, session):
+        """Submit one FFmpeg process per clip; yields (index, success, msg)"""
+        num_clips = self.settings['num_clips']
+        clip_length = self.settings['clip_length']
+        
+        # Everything but the seek and output path is shared by all clips
+        command = FFmpegRenderer.build_clip_command(
+            clip_length,
+            self.settings['animation_video'],
+            self.settings['background_video'],
+            self.settings['music_file'],
+            self.settings['music_start'],
+            self.settings['codec'],
+            self.settings['normalize_audio'],
+            self.settings['hw_filters'],
+            self.threads_per_process(),
+            self.settings['encoder_preset'],
+            self.settings['bg_decode_args'],
+            self.settings['bg_size'],
+        )
+        
+        # Encoded seconds per clip, updated from the pool threads
+        encoded = [0.0] * num_clips
+        total_length = num_clips * clip_length
+        status = f"Rendering {num_clips} clips..."
+        next_emit = [0]
+        
+        def on_encoded(index, seconds):
+            encoded[index] = seconds
+            now = time.monotonic()
+            if now < next_emit[0]:
+                return
+            with self.progress_lock:
+                percent = min(99, int(sum(encoded) / total_length * 100))
+                if now >= next_emit[0] and percent > self.encoded_percent:
+                    next_emit[0] = now + PROGRESS_INTERVAL
+                    self.encoded_percent = percent
+                    self.progress.emit(percent, status)
+        
+        tasks = (
+            (command, i, clip_length,
+             session.generate_clip_filename(i, clip_length), session.log_dir,
+             partial(on_encoded, i))
+            for i in range(num_clips)
+        )
+        return (
+            (index, success, msg)
+            for index, (success, msg)
+            in self.map_window(executor, FFmpegRenderer.render_clip_command, tasks)
+        )
+    
+    def submit_batches(self, executor, session, batch_size):
+        """Submit one FFmpeg process per batch; yields (index, success, msg)"""
+        num_clips = self.settings['num_clips']
+        clip_length = self.settings['clip_length']
+        output_pattern = session.generate_clip_pattern(clip_length)
+        
+        tasks = (
+            (
+                min(batch_size, num_clips - first),
+                clip_length,
+                self.settings['animation_video'],
+                self.settings['background_video'],
+                self.settings['music_file'],
+                self.settings['music_start'],
+                output_pattern,
+                self.settings['codec'],
+                self.settings['normalize_audio'],
+                session.log_dir,
+                self.settings['hw_filters'],
+                first,
+                self.threads_per_process(),
+                self.settings['encoder_preset'],
+                self.settings['bg_decode_args'],
+                self.settings['bg_size'],
+            )
+            for first in range(0, num_clips, batch_size)
+        )
+        
+        batches = self.map_window(executor, FFmpegRenderer.render_batch, tasks)
+        return (
+            (batch_index * batch_size + offset, success, msg)
+            for batch_index, batch in batches
+            for offset, (success, msg) in enumerate(batch)
+        )
 
 
 class AutoCutterGUI(QMainWindow):
+    RECALC_DEBOUNCE_MS = 50
+    PROGRESS_REFRESH_MS = 33
+    
+    STATUS_INITIALIZING = "🔄 Initializing..."
+    STATUS_PROGRESS_PREFIX = "🔄 "
+    STATUS_ERROR = "❌ Error"
+    
     def __init__(self):
         super().__init__()
         self.setWindowTitle("AutoCutter - Professional Video Clip Generator")
@@ -367,6 +888,11 @@ class AutoCutterGUI(QMainWindow):
         # Load config
         self.config = ConfigManager()
         
+        # Render pool kept warm across sessions (created on first render)
+        self.render_pool = None
+        self.render_pool_workers = 0
+        self.worker = None
+        
         # Check FFmpeg
         if not FileManager.check_ffmpeg_available():
             QMessageBox.critical(
@@ -377,6 +903,27 @@ class AutoCutterGUI(QMainWindow):
             )
             sys.exit(1)
         
+        # Probe encoders once up front so codec lookups are free later
+        FFmpegRenderer.list_encoders()
+        
+        # Coalesce bursts of value changes (e.g. holding a spin box arrow)
+        # into one label/stylesheet update
+        self.recalc_timer = QTimer(self)
+        self.recalc_timer.setSingleShot(True)
+        self.recalc_timer.setInterval(self.RECALC_DEBOUNCE_MS)
+        self.recalc_timer.timeout.connect(self.update_calculations)
+        self.music_end_timer = QTimer(self)
+        self.music_end_timer.setSingleShot(True)
+        self.music_end_timer.setInterval(self.RECALC_DEBOUNCE_MS)
+        self.music_end_timer.timeout.connect(self.update_music_end)
+        
+        # Progress signals only store the latest value; the timer paints it
+        # at most ~30 times a second
+        self.pending_progress = None
+        self.progress_timer = QTimer(self)
+        self.progress_timer.setInterval(self.PROGRESS_REFRESH_MS)
+        self.progress_timer.timeout.connect(self.apply_progress)
+        
         self.setup_ui()
         self.load_settings_from_config()
         
@@ -410,15 +957,16 @@ class AutoCutterGUI(QMainWindow):
         
         # === FILE INPUTS (HORIZONTAL) ===
         files_group = QGroupBox("📁 Input Files")
-        files_group.setStyleSheet("QGroupBox { font-weight: bold; }")
         files_layout = QHBoxLayout()
         files_layout.setSpacing(10)
         
         self.bg_picker = CompactFilePicker(
             "Background Video",
-            "Videos (*.mp4 *.mov *.mkv *.avi *.webm)"
+            "Videos (*.mp4 *.mov *.mkv *.avi *.webm)",
+            probe_details=True  # Codec and size pick the render pipeline
         )
         self.bg_picker.file_selected.connect(self.on_background_changed)
+        self.bg_picker.duration_changed.connect(self.schedule_calculations)
         files_layout.addWidget(self.bg_picker)
         
         self.anim_picker = CompactFilePicker(
@@ -426,6 +974,7 @@ class AutoCutterGUI(QMainWindow):
             "Videos (*.mov *.mp4 *.mkv *.webm)"
         )
         self.anim_picker.file_selected.connect(self.on_animation_changed)
+        self.anim_picker.duration_changed.connect(self.on_animation_duration)
         files_layout.addWidget(self.anim_picker)
         
         self.music_picker = CompactFilePicker(
@@ -433,6 +982,7 @@ class AutoCutterGUI(QMainWindow):
             "Audio (*.mp3 *.wav *.aac *.m4a *.ogg)"
         )
         self.music_picker.file_selected.connect(self.on_music_changed)
+        self.music_picker.duration_changed.connect(self.schedule_music_end)
         files_layout.addWidget(self.music_picker)
         
         files_group.setLayout(files_layout)
@@ -440,7 +990,6 @@ class AutoCutterGUI(QMainWindow):
         
         # === SETTINGS ===
         settings_group = QGroupBox("⚙️ Clip Configuration")
-        settings_group.setStyleSheet("QGroupBox { font-weight: bold; }")
         settings_layout = QVBoxLayout()
         settings_layout.setSpacing(10)
         
@@ -451,7 +1000,7 @@ class AutoCutterGUI(QMainWindow):
         self.clip_length_spin.setRange(1, 60)
         self.clip_length_spin.setValue(10)
         self.clip_length_spin.setFixedWidth(80)
-        self.clip_length_spin.valueChanged.connect(self.update_calculations)
+        self.clip_length_spin.valueChanged.connect(self.schedule_calculations)
         row1.addWidget(self.clip_length_spin)
         
         row1.addSpacing(20)
@@ -477,7 +1026,6 @@ class AutoCutterGUI(QMainWindow):
         
         # === MUSIC ===
         music_group = QGroupBox("🎵 Music Selection")
-        music_group.setStyleSheet("QGroupBox { font-weight: bold; }")
         music_layout = QVBoxLayout()
         music_layout.setSpacing(8)
         
@@ -497,13 +1045,13 @@ class AutoCutterGUI(QMainWindow):
         self.music_start_spin.setDecimals(1)
         self.music_start_spin.setSingleStep(0.5)
         self.music_start_spin.setFixedWidth(80)
-        self.music_start_spin.valueChanged.connect(self.update_music_end)
+        self.music_start_spin.valueChanged.connect(self.schedule_music_end)
         start_layout.addWidget(self.music_start_spin)
         start_layout.addWidget(QLabel("seconds"))
         
         start_layout.addSpacing(20)
         self.music_end_label = QLabel("End: 10.0s")
-        self.music_end_label.setStyleSheet("color: #4CAF50;")
+        self.music_end_label.setObjectName("musicEndLabel")
         start_layout.addWidget(self.music_end_label)
         start_layout.addStretch()
         music_layout.addLayout(start_layout)
@@ -513,7 +1061,6 @@ class AutoCutterGUI(QMainWindow):
         
         # === ADVANCED ===
         advanced_group = QGroupBox("🔧 Advanced Options")
-        advanced_group.setStyleSheet("QGroupBox { font-weight: bold; }")
         advanced_layout = QHBoxLayout()
         
         self.gpu_checkbox = QCheckBox("GPU Encoding (NVENC)")
@@ -523,14 +1070,50 @@ class AutoCutterGUI(QMainWindow):
         self.normalize_checkbox.setChecked(True)
         advanced_layout.addWidget(self.normalize_checkbox)
         
+        self.single_pass_checkbox = QCheckBox("Single-Pass Render")
+        self.single_pass_checkbox.setToolTip(
+            "Decode the background once and split it into clips in one FFmpeg run"
+        )
+        advanced_layout.addWidget(self.single_pass_checkbox)
+        
+        self.batch_render_checkbox = QCheckBox("Batch Clips")
+        self.batch_render_checkbox.setToolTip(
+            "Render several clips per FFmpeg run; clip edges snap to "
+            "keyframes and may differ slightly from per-clip renders"
+        )
+        advanced_layout.addWidget(self.batch_render_checkbox)
+        
+        self.seek_proxy_checkbox = QCheckBox("Seek Proxy")
+        self.seek_proxy_checkbox.setToolTip(
+            "Transcode the background to an all-intra proxy first so every "
+            "clip seeks instantly (helps long-GOP backgrounds and many clips)"
+        )
+        advanced_layout.addWidget(self.seek_proxy_checkbox)
+        
+        cpus = available_cpus()
         advanced_layout.addSpacing(20)
         advanced_layout.addWidget(QLabel("Workers:"))
         self.workers_spin = QSpinBox()
-        self.workers_spin.setRange(1, os.cpu_count() or 4)
-        self.workers_spin.setValue(max(1, (os.cpu_count() or 2) // 2))
+        self.workers_spin.setRange(1, min(cpus, MAX_RENDER_WORKERS))
+        self.workers_spin.setValue(max(1, cpus // 2))
         self.workers_spin.setFixedWidth(60)
         advanced_layout.addWidget(self.workers_spin)
         
+        advanced_layout.addWidget(QLabel("FFmpeg threads:"))
+        self.threads_spin = QSpinBox()
+        self.threads_spin.setRange(0, cpus)
+        self.threads_spin.setSpecialValueText("Auto")
+        self.threads_spin.setToolTip("Threads per FFmpeg process (Auto = CPUs / workers)")
+        self.threads_spin.setFixedWidth(60)
+        advanced_layout.addWidget(self.threads_spin)
+        
+        advanced_layout.addWidget(QLabel("Encoding:"))
+        self.preset_combo = QComboBox()
+        self.preset_combo.addItem("Speed", "speed")
+        self.preset_combo.addItem("Quality", "quality")
+        self.preset_combo.setToolTip("Encoder preset: faster renders vs. better compression")
+        advanced_layout.addWidget(self.preset_combo)
+        
         advanced_layout.addStretch()
         advanced_group.setLayout(advanced_layout)
         main_layout.addWidget(advanced_group)
@@ -590,34 +1173,54 @@ class AutoCutterGUI(QMainWindow):
         """Load settings from config"""
         self.clip_length_spin.setValue(self.config.get('default_clip_length', 10))
         self.workers_spin.setValue(self.config.get('default_workers', 2))
-        self.gpu_checkbox.setChecked(self.config.get('prefer_gpu', False))
+        self.threads_spin.setValue(self.config.get('ffmpeg_threads', 0))
+        preset_index = self.preset_combo.findData(self.config.get('encoder_preset', 'speed'))
+        self.preset_combo.setCurrentIndex(max(0, preset_index))
+        self.gpu_checkbox.setChecked(self.config.get('prefer_gpu', True))
         self.normalize_checkbox.setChecked(self.config.get('use_audio_normalization', True))
+        self.single_pass_checkbox.setChecked(self.config.get('single_pass_render', False))
+        self.batch_render_checkbox.setChecked(self.config.get('batch_render', False))
+        self.seek_proxy_checkbox.setChecked(self.config.get('seek_proxy', False))
+        self.prefetch_recent_media()
+    
+    def prefetch_recent_media(self):
+        """Probe the last used file of each kind in the background"""
+        paths = []
+        for file_type in ('backgrounds', 'animations', 'music'):
+            paths += self.config.get_recent_files(file_type)[:1]
+        if paths:
+            QThreadPool.globalInstance().start(MediaPrefetchTask(paths))
     
     def save_settings_to_config(self):
         """Save current settings to config"""
         self.config.set('default_clip_length', self.clip_length_spin.value())
         self.config.set('default_workers', self.workers_spin.value())
+        self.config.set('ffmpeg_threads', self.threads_spin.value())
+        self.config.set('encoder_preset', self.preset_combo.currentData())
         self.config.set('prefer_gpu', self.gpu_checkbox.isChecked())
         self.config.set('use_audio_normalization', self.normalize_checkbox.isChecked())
+        self.config.set('single_pass_render', self.single_pass_checkbox.isChecked())
+        self.config.set('batch_render', self.batch_render_checkbox.isChecked())
+        self.config.set('seek_proxy', self.seek_proxy_checkbox.isChecked())
         self.config.save_config()
     
     def on_background_changed(self, file_path):
         self.config.add_recent_file('backgrounds', file_path)
-        self.update_calculations()
     
     def on_animation_changed(self, file_path):
         self.config.add_recent_file('animations', file_path)
-        if self.anim_picker.duration > 0:
-            max_duration = int(self.anim_picker.duration)
+    
+    def on_animation_duration(self, duration):
+        if duration > 0:
+            max_duration = int(duration)
             self.clip_length_spin.setMaximum(max_duration)
             if self.clip_length_spin.value() > max_duration:
                 self.clip_length_spin.setValue(max_duration)
-        self.update_calculations()
+        self.schedule_calculations()
     
     def on_music_changed(self, file_path):
         self.config.add_recent_file('music', file_path)
         self.music_player.load_music(file_path)
-        self.update_music_end()
     
     def on_music_position_set(self, position):
         self.music_start_spin.setValue(position)
@@ -627,6 +1230,14 @@ class AutoCutterGUI(QMainWindow):
             f"Music start: {position:.1f}s"
         )
     
+    def schedule_calculations(self):
+        """Debounced update_calculations (restarts the timer)"""
+        self.recalc_timer.start()
+    
+    def schedule_music_end(self):
+        """Debounced update_music_end (restarts the timer)"""
+        self.music_end_timer.start()
+    
     def update_calculations(self):
         bg_dur = self.bg_picker.duration
         clip_len = self.clip_length_spin.value()
@@ -640,6 +1251,7 @@ class AutoCutterGUI(QMainWindow):
         else:
             self.max_clips_label.setText("Max clips: --")
         
+        self.music_end_timer.stop()
         self.update_music_end()
     
     def update_music_end(self):
@@ -647,13 +1259,12 @@ class AutoCutterGUI(QMainWindow):
         duration = self.clip_length_spin.value()
         end = start + duration
         
-        self.music_end_label.setText(f"End: {end:.1f}s (Duration: {duration}s)")
-        
-        if self.music_picker.duration > 0 and end > self.music_picker.duration:
-            self.music_end_label.setStyleSheet("color: #f44336; font-weight: bold;")
+        exceeds = self.music_picker.duration > 0 and end > self.music_picker.duration
+        if exceeds:
             self.music_end_label.setText(f"End: {end:.1f}s ⚠️ EXCEEDS music!")
         else:
-            self.music_end_label.setStyleSheet("color: #4CAF50;")
+            self.music_end_label.setText(f"End: {end:.1f}s (Duration: {duration}s)")
+        set_style_state(self.music_end_label, "exceeds", exceeds)
     
     def validate_inputs(self):
         errors = []
@@ -673,6 +1284,11 @@ class AutoCutterGUI(QMainWindow):
         if self.music_picker.duration > 0 and music_end > self.music_picker.duration:
             errors.append(f"❌ Music segment exceeds music duration")
         
+        # Durations were probed when the files were picked; no ffprobe here
+        total_length = self.clip_length_spin.value() * self.num_clips_spin.value()
+        if self.bg_picker.duration > 0 and total_length > self.bg_picker.duration:
+            errors.append(f"❌ Clips exceed background duration")
+        
         return errors
     
     def start_rendering(self):
@@ -688,6 +1304,18 @@ class AutoCutterGUI(QMainWindow):
         
         # Get codec
         codec = FFmpegRenderer.get_best_codec(self.gpu_checkbox.isChecked())
+        hw_filters = (
+            codec == "h264_nvenc" and FFmpegRenderer.check_cuda_filters_available()
+        )
+        bg_info = self.bg_picker.media_info or FileManager.get_media_info(
+            self.bg_picker.file_path
+        )
+        bg_decode_args = []
+        # CUVID crops and resizes coded frames, before any autorotation
+        if hw_filters and not bg_info.get('rotation'):
+            bg_decode_args = FFmpegRenderer.build_cuda_decode_args(
+                bg_info.get('codec'), bg_info.get('width'), bg_info.get('height')
+            )
         
         # Prepare settings
         settings = {
@@ -698,8 +1326,18 @@ class AutoCutterGUI(QMainWindow):
             'num_clips': self.num_clips_spin.value(),
             'music_start': self.music_start_spin.value(),
             'codec': codec,
+            'hw_filters': hw_filters,
+            'bg_decode_args': bg_decode_args,
+            'bg_size': (bg_info.get('width', 0), bg_info.get('height', 0)),
             'normalize_audio': self.normalize_checkbox.isChecked(),
-            'workers': self.workers_spin.value(),
+            'single_pass': self.single_pass_checkbox.isChecked(),
+            'batch_render': self.batch_render_checkbox.isChecked(),
+            'seek_proxy': self.seek_proxy_checkbox.isChecked(),
+            'workers': render_pool_size(
+                self.workers_spin.value(), self.threads_spin.value(), codec
+            ),
+            'ffmpeg_threads': self.threads_spin.value(),
+            'encoder_preset': self.preset_combo.currentData(),
             'output_dir': self.config.get('last_output_dir', './output')
         }
         
@@ -709,6 +1347,10 @@ class AutoCutterGUI(QMainWindow):
             "Confirm Rendering",
             f"Ready to render {settings['num_clips']} clips?\n\n"
             f"Clip length: {settings['clip_length']}s\n"
+            f"Background used: {settings['clip_length'] * settings['num_clips']:.0f}s"
+            f" of {self.bg_picker.duration:.0f}s\n"
+            f"Music segment: {settings['music_start']:.1f}s - "
+            f"{settings['music_start'] + settings['clip_length']:.1f}s\n"
             f"Codec: {codec}\n"
             f"Workers: {settings['workers']}",
             QMessageBox.Yes | QMessageBox.No
@@ -722,23 +1364,66 @@ class AutoCutterGUI(QMainWindow):
         self.render_button.setEnabled(False)
         self.progress_bar.setVisible(True)
         self.progress_bar.setValue(0)
-        self.status_label.setText("🔄 Initializing...")
-        
-        self.worker = RenderWorker(settings)
-        self.worker.progress.connect(self.on_progress)
-        self.worker.finished.connect(self.on_finished)
-        self.worker.error.connect(self.on_error)
+        self.status_label.setText(self.STATUS_INITIALIZING)
+        
+        pool = None
+        if (not settings.get('single_pass') and settings['num_clips'] > 1
+                and settings['workers'] > 1):
+            pool = self.get_render_pool(settings['workers'])
+        
+        self.worker = RenderWorker(settings, pool)
+        self.worker.progress.connect(self.on_progress, Qt.QueuedConnection)
+        self.worker.finished.connect(self.on_finished, Qt.QueuedConnection)
+        self.worker.error.connect(self.on_error, Qt.QueuedConnection)
+        self.progress_timer.start()
         self.worker.start()
         
         logger.info("Rendering started")
     
+    def get_render_pool(self, workers):
+        """Get the persistent render pool, recreating it if its size changed"""
+        if self.render_pool is None or self.render_pool_workers != workers:
+            self.shutdown_render_pool()
+            self.render_pool = create_render_pool(workers)
+            self.render_pool_workers = workers
+        return self.render_pool
+    
+    def shutdown_render_pool(self):
+        """Shut down the persistent render pool, if any"""
+        if self.render_pool is not None:
+            self.render_pool.shutdown(wait=False, cancel_futures=True)
+            self.render_pool = None
+            self.render_pool_workers = 0
+    
     def on_progress(self, value, clip_name):
-        self.progress_bar.setValue(value)
-        self.status_label.setText(f"🔄 {clip_name}")
+        self.pending_progress = (value, clip_name)
+    
+    def apply_progress(self):
+        """Show the latest progress received since the last refresh"""
+        if self.pending_progress is None:
+            return
+        value, clip_name = self.pending_progress
+        self.pending_progress = None
+        if value != self.progress_bar.value():
+            self.progress_bar.setValue(value)
+        status = self.STATUS_PROGRESS_PREFIX + clip_name
+        if status != self.status_label.text():
+            self.status_label.setText(status)
+    
+    def stop_progress_updates(self):
+        """Stop the progress refresh timer and drop any unshown update"""
+        self.progress_timer.stop()
+        self.pending_progress = None
     
-    def on_finished(self, message, results):
+    def on_finished(self, message, success_count, total_count):
+        self.stop_progress_updates()
         self.progress_bar.setVisible(False)
-        self.status_label.setText("✅ Complete!")
+        if success_count == total_count:
+            self.status_label.setText(f"✅ Complete! ({success_count}/{total_count})")
+        else:
+            self.status_label.setText(
+                f"⚠️ Complete with errors ({success_count}/{total_count} succeeded)"
+            )
         self.render_button.setEnabled(True)
         
         self.save_settings_to_config()
@@ -747,22 +1432,30 @@ class AutoCutterGUI(QMainWindow):
         logger.info("Rendering completed successfully")
     
     def on_error(self, error_msg):
+        self.stop_progress_updates()
         self.progress_bar.setVisible(False)
-        self.status_label.setText("❌ Error")
+        self.status_label.setText(self.STATUS_ERROR)
         self.render_button.setEnabled(True)
         
         QMessageBox.critical(self, "Error", f"Rendering failed:\n\n{error_msg}")
         logger.error(f"Rendering error: {error_msg}")
     
     def closeEvent(self, event):
-        """Save config on close"""
+        """Save config and stop render workers on close"""
         self.save_settings_to_config()
+        if self.worker is not None and self.worker.isRunning():
+            # Stop queuing clips; the ones already running still finish
+            self.worker.requestInterruption()
+        self.shutdown_render_pool()
         event.accept()
 
 
 def main():
+    setup_logging()
+    
     app = QApplication(sys.argv)
     app.setStyle("Fusion")
+    app.setStyleSheet(APP_STYLESHEET)
     
     window = AutoCutterGUI()
     window.show()
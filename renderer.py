@@ -4,8 +4,15 @@ Renderer Module - Handles FFmpeg rendering operations
 """
 
 import os
+import re
+import json
+import time
 import subprocess
 import logging
+import threading
+from collections import deque
+from functools import lru_cache
+from shutil import which
 from datetime import datetime
 from pathlib import Path
 
@@ -17,10 +24,187 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Encoder tuning per speed/quality trade-off. Output is bitrate-capped at
+# 3500k, so the fast presets lose little visible quality.
+ENCODER_PRESETS = {
+    "speed": {
+        "libx264": [
+            "-preset", "veryfast", "-tune", "zerolatency",
+            "-x264-params", "rc-lookahead=10",
+        ],
+        "h264_nvenc": ["-preset", "p1", "-tune", "ll", "-rc", "cbr"],
+    },
+    "quality": {
+        "libx264": ["-preset", "medium"],
+        "h264_nvenc": ["-preset", "p4", "-tune", "hq", "-rc", "vbr", "-bf", "3"],
+    },
+}
+
+# AAC encoder tuning per preset. The fast coder skips the two-loop search,
+# which is inaudible at 192k.
+AUDIO_PRESETS = {
+    "speed": ["-aac_coder", "fast"],
+    "quality": [],
+}
+
+# FFmpeg executable, resolved to an absolute path once at import
+FFMPEG_PATH = which("ffmpeg") or "ffmpeg"
+
+
+def available_cpus():
+    """
+    Get the number of CPUs this process may run on
+    
+    Honours the affinity mask (e.g. taskset or container CPU pinning)
+    where the platform exposes it, unlike os.cpu_count().
+    
+    Returns:
+        int: Usable CPU count
+    """
+    if hasattr(os, "sched_getaffinity"):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count() or 4
+
+
+# Overlay filter graphs. Clip length is applied with input-level -t, so
+# the graph is byte-identical for every clip in a session. {bg} is the
+# background crop/scale chain from build_background_filter(). The overlay
+# ends with the background; the looped animation never runs out first, so
+# no shortest=1 is needed.
+FILTER_GRAPH = (
+    "[0:v]setpts=PTS-STARTPTS,format=rgba[main];"
+    "[1:v]setpts=PTS-STARTPTS{bg}[bg];"
+    "[bg][main]overlay=(W-w)/2:(H-h)/2[v]"
+)
+
+# GPU variant used when no CUVID decoder fits: frames are decoded into
+# system memory, cropped and uploaded, so only scale and overlay run on
+# CUDA frames that go straight to NVENC. This path makes a host round trip
+# per frame; only FILTER_GRAPH_CUDA_DECODED keeps the background on the GPU
+FILTER_GRAPH_CUDA = (
+    "[0:v]setpts=PTS-STARTPTS,format=yuva420p,hwupload_cuda[main];"
+    "[1:v]setpts=PTS-STARTPTS{bg}[bg];"
+    "[bg][main]overlay_cuda=x=(W-w)/2:y=(H-h)/2[v]"
+)
+
+# Fully GPU-resident variant: the CUVID decoder already cropped and resized
+# the background, which only needs converting to overlay_cuda's format
+FILTER_GRAPH_CUDA_DECODED = (
+    "[0:v]setpts=PTS-STARTPTS,format=yuva420p,hwupload_cuda[main];"
+    "[1:v]setpts=PTS-STARTPTS,scale_cuda=format=yuv420p[bg];"
+    "[bg][main]overlay_cuda=x=(W-w)/2:y=(H-h)/2[v]"
+)
+
+OUTPUT_WIDTH, OUTPUT_HEIGHT = 1080, 1920
+
+# One named CUDA device shared by the decoder, hwupload_cuda and the
+# encoder, so a GPU render opens a single CUDA context
+CUDA_DEVICE_ARGS = ["-init_hw_device", "cuda=cu:0", "-filter_hw_device", "cu"]
+
+# Seconds between summary file flushes while results stream in
+SUMMARY_FLUSH_INTERVAL = 1.0
+
+# Settings shown by file name only in the session summary
+SUMMARY_PATH_KEYS = frozenset({
+    "background_video", "animation_video", "music_file", "output_dir"
+})
+
+# EBU R128 loudness target applied to the music
+LOUDNORM_FILTER = "loudnorm=I=-16:LRA=11:TP=-1.5"
+
+# JSON object in loudnorm's print_format=json report; FFmpeg may print its
+# final stats line after it, so the last match after the marker is used
+LOUDNORM_MARKER = "[Parsed_loudnorm_"
+LOUDNORM_REPORT = re.compile(r"\{[^{}]*\}")
+
+
+def build_background_filter(bg_size=None, hw_filters=False):
+    """
+    Build the background crop/scale chain, skipping steps that are no-ops
+    
+    Args:
+        bg_size: (width, height) of the background, or None if unknown
+        hw_filters: Scale on the GPU (for FILTER_GRAPH_CUDA)
+        
+    Returns:
+        str: Filter chain to append after setpts (starts with ',')
+    """
+    width, height = bg_size or (0, 0)
+    if (width, height) == (OUTPUT_WIDTH, OUTPUT_HEIGHT):
+        steps = []
+    elif width and width * OUTPUT_HEIGHT == height * OUTPUT_WIDTH:
+        steps = ["scale"]
+    else:
+        steps = ["crop", "scale"]
+    
+    chain = ""
+    if "crop" in steps:
+        chain += ",crop=ih*9/16:ih"
+    if hw_filters:
+        chain += ",format=yuv420p,hwupload_cuda"
+        if "scale" in steps:
+            chain += f",scale_cuda={OUTPUT_WIDTH}:{OUTPUT_HEIGHT}"
+    elif "scale" in steps:
+        chain += f",scale={OUTPUT_WIDTH}:{OUTPUT_HEIGHT}"
+    return chain
+
+
+# Name column of `ffmpeg -encoders/-decoders/-filters` rows, e.g.
+# " V....D libx264 ..." or " TSC acompressor ..."; legend rows ("= Video")
+# are skipped
+COMPONENT_LINE = re.compile(r"^ [A-Z.|]{3,6} +([^=\s]\S*)", re.M)
+
 
 class FFmpegRenderer:
     """Handles FFmpeg rendering operations"""
     
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def _list_components(kind):
+        """
+        List FFmpeg components of one kind (probed once per process)
+        
+        Args:
+            kind: 'encoders', 'decoders' or 'filters'
+            
+        Returns:
+            frozenset: Component names
+        """
+        try:
+            result = subprocess.run(
+                [FFMPEG_PATH, "-hide_banner", f"-{kind}"],
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                text=True,
+                check=False,
+                timeout=5
+            )
+        except Exception as e:
+            logger.error(f"Error listing {kind}: {e}")
+            return frozenset()
+        
+        return frozenset(COMPONENT_LINE.findall(result.stdout))
+    
+    @staticmethod
+    def list_encoders():
+        """
+        Get the set of encoders FFmpeg supports (probed once per process)
+        
+        Returns:
+            frozenset: Encoder names
+        """
+        return FFmpegRenderer._list_components("encoders")
+    
+    @staticmethod
+    def list_decoders():
+        """
+        Get the set of decoders FFmpeg supports (probed once per process)
+        
+        Returns:
+            frozenset: Decoder names
+        """
+        return FFmpegRenderer._list_components("decoders")
+    
     @staticmethod
     def check_encoder_available(encoder_name):
         """
@@ -32,22 +216,122 @@ class FFmpegRenderer:
         Returns:
             bool: True if encoder is available
         """
+        return encoder_name in FFmpegRenderer.list_encoders()
+    
+    @staticmethod
+    def list_filters():
+        """
+        Get the set of filters FFmpeg supports (probed once per process)
+        
+        Returns:
+            frozenset: Filter names
+        """
+        return FFmpegRenderer._list_components("filters")
+    
+    @staticmethod
+    def check_cuda_filters_available():
+        """
+        Check if the CUDA filters used by the GPU pipeline are available
+        
+        Returns:
+            bool: True if hwupload_cuda, scale_cuda and overlay_cuda exist
+        """
+        required = {"hwupload_cuda", "scale_cuda", "overlay_cuda"}
+        return required <= FFmpegRenderer.list_filters()
+    
+    @staticmethod
+    def build_cuda_decode_args(codec_name, width, height):
+        """
+        Build background decoder arguments that keep frames on the GPU
+        
+        The CUVID decoder crops to 9:16 and resizes to 1080x1920 itself, so
+        the background never leaves GPU memory.
+        
+        Args:
+            codec_name: Background video codec (e.g., 'h264')
+            width: Background width in pixels
+            height: Background height in pixels
+            
+        Returns:
+            list: FFmpeg input arguments, or [] if no CUVID decoder fits
+        """
+        decoder = f"{codec_name}_cuvid"
+        if not (codec_name and width and height):
+            return []
+        if decoder not in FFmpegRenderer.list_decoders():
+            return []
+        
+        crop_width = min(width, int(height * 9 / 16) // 2 * 2)
+        left = (width - crop_width) // 2
+        right = width - crop_width - left
+        return [
+            "-hwaccel", "cuda",
+            "-hwaccel_device", "cu",
+            "-hwaccel_output_format", "cuda",
+            "-c:v", decoder,
+            "-crop", f"0x0x{left}x{right}",
+            "-resize", f"{OUTPUT_WIDTH}x{OUTPUT_HEIGHT}",
+        ]
+    
+    @staticmethod
+    def select_video_pipeline(hw_filters=False, bg_decode_args=None, bg_size=None):
+        """
+        Pick background input arguments and the matching filter graph
+        
+        Args:
+            hw_filters: Run scale and overlay on the GPU
+            bg_decode_args: Arguments from build_cuda_decode_args(), if any
+            bg_size: (width, height) of the background, if known
+            
+        Returns:
+            tuple: (background input args: list, filter graph: str)
+        """
+        if hw_filters and bg_decode_args:
+            return list(bg_decode_args), FILTER_GRAPH_CUDA_DECODED
+        bg_filter = build_background_filter(bg_size, hw_filters)
+        if hw_filters:
+            # No -hwaccel_output_format: decoded frames land in system memory
+            # so the CPU crop (and FFmpeg's software fallback for codecs NVDEC
+            # lacks) still work before hwupload_cuda
+            return (
+                ["-hwaccel", "cuda", "-hwaccel_device", "cu"],
+                FILTER_GRAPH_CUDA.format(bg=bg_filter)
+            )
+        return [], FILTER_GRAPH.format(bg=bg_filter)
+    
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def check_nvenc_usable():
+        """
+        Check that NVENC can actually open a session (probed once per process)
+        
+        Many FFmpeg builds list h264_nvenc without an NVIDIA GPU or driver
+        being present, so a tiny test encode is the only reliable check.
+        
+        Returns:
+            bool: True if h264_nvenc encodes on this machine
+        """
+        if not FFmpegRenderer.check_encoder_available("h264_nvenc"):
+            return False
         try:
             result = subprocess.run(
-                ["ffmpeg", "-hide_banner", "-encoders"],
-                stdout=subprocess.PIPE,
+                [
+                    FFMPEG_PATH, "-hide_banner", "-v", "error",
+                    "-f", "lavfi", "-i", "color=size=256x256:duration=0.1",
+                    "-c:v", "h264_nvenc", "-f", "null", "-"
+                ],
+                stdout=subprocess.DEVNULL,
                 stderr=subprocess.DEVNULL,
-                text=True,
                 check=False,
-                timeout=5
+                timeout=10
             )
-            return encoder_name in result.stdout
         except Exception as e:
-            logger.error(f"Error checking encoder {encoder_name}: {e}")
+            logger.error(f"Error testing NVENC: {e}")
             return False
+        return result.returncode == 0
     
     @staticmethod
-    def get_best_codec(prefer_gpu=False):
+    def get_best_codec(prefer_gpu=True):
         """
         Get best available codec
         
@@ -57,7 +341,7 @@ class FFmpegRenderer:
         Returns:
             str: Codec name ('h264_nvenc' or 'libx264')
         """
-        if prefer_gpu and FFmpegRenderer.check_encoder_available("h264_nvenc"):
+        if prefer_gpu and FFmpegRenderer.check_nvenc_usable():
             logger.info("Using GPU encoder: h264_nvenc")
             return "h264_nvenc"
         
@@ -65,75 +349,230 @@ class FFmpegRenderer:
         return "libx264"
     
     @staticmethod
-    def render_clip(
-        segment_index,
+    def build_video_codec_args(codec, hw_filters=False, preset="speed"):
+        """
+        Build video encoder arguments
+        
+        Args:
+            codec: Video codec to use
+            hw_filters: Whether frames arrive as CUDA frames
+            preset: Key into ENCODER_PRESETS ('speed' or 'quality')
+            
+        Returns:
+            list: FFmpeg output arguments
+        """
+        args = ["-c:v", codec]
+        args += ENCODER_PRESETS.get(preset, ENCODER_PRESETS["speed"]).get(codec, [])
+        args += ["-b:v", "3500k"]
+        if not hw_filters:
+            # NVENC takes semi-planar NV12 as its native surface layout
+            args += ["-pix_fmt", "nv12" if codec == "h264_nvenc" else "yuv420p"]
+        # Shared timescale keeps every clip concat-copy compatible
+        args += ["-video_track_timescale", "15360"]
+        return args
+    
+    @staticmethod
+    def build_audio_codec_args(preset="speed"):
+        """
+        Build audio encoder arguments
+        
+        Args:
+            preset: Key into AUDIO_PRESETS ('speed' or 'quality')
+            
+        Returns:
+            list: FFmpeg output arguments
+        """
+        return [
+            "-c:a", "aac",
+            *AUDIO_PRESETS.get(preset, AUDIO_PRESETS["speed"]),
+            "-b:a", "192k",
+        ]
+    
+    @staticmethod
+    def build_thread_args(threads):
+        """
+        Build FFmpeg thread limits for decode, filtering and encode
+        
+        Args:
+            threads: Threads per stage (0 for FFmpeg's default)
+            
+        Returns:
+            dict: Argument lists under 'global', 'input' and 'output'
+        """
+        if not threads:
+            return {"global": [], "input": [], "output": []}
+        return {
+            "global": ["-filter_complex_threads", str(threads)],
+            "input": ["-threads", str(threads)],
+            "output": ["-threads", str(threads)],
+        }
+    
+    @staticmethod
+    def build_clip_command(
         clip_length,
         animation_video,
         background_video,
         music_file,
         music_start,
-        output_path,
         codec="libx264",
         use_loudnorm=False,
-        log_dir=None
+        hw_filters=False,
+        threads=0,
+        preset="speed",
+        bg_decode_args=None,
+        bg_size=None
     ):
         """
-        Render a single video clip
+        Build the per-session part of a clip command
+        
+        Everything except the background seek and the output path is the
+        same for every clip, so this is built once and reused per clip by
+        render_clip_command().
         
         Args:
-            segment_index: Index of the segment
             clip_length: Length of clip in seconds
             animation_video: Path to animation/overlay video
             background_video: Path to background video
             music_file: Path to music file
             music_start: Start time in music file
-            output_path: Output file path
             codec: Video codec to use
             use_loudnorm: Whether to apply audio normalization
-            log_dir: Directory for log files
+            hw_filters: Run decode, scale and overlay on the GPU (NVENC only)
+            threads: FFmpeg thread count per stage (0 lets FFmpeg decide)
+            preset: Encoder preset key ('speed' or 'quality')
+            bg_decode_args: GPU decoder arguments for the background
+            bg_size: (width, height) of the background, if known
             
         Returns:
-            tuple: (success: bool, message: str)
+            tuple: (prefix: list, suffix: list) surrounding the background
+                   seek; the executable and output path are not included
         """
-        bg_start_time = segment_index * clip_length
+        bg_hwaccel, filter_graph = FFmpegRenderer.select_video_pipeline(
+            hw_filters, bg_decode_args, bg_size
+        )
+        thread_args = FFmpegRenderer.build_thread_args(threads)
         
-        # Build FFmpeg command
-        cmd = [
-            "ffmpeg",
+        prefix = [
             "-y",
-            # Animation video (overlay) - loop to ensure coverage
-            "-stream_loop", "1",
+            *thread_args["global"],
+            *(CUDA_DEVICE_ARGS if hw_filters else []),
+            # Animation video (overlay) - loops only if shorter than the
+            # clip; -t stops the demuxer as soon as the clip is covered
+            # Only the video of the first two inputs is used, so their
+            # audio streams are discarded at the demuxer
+            "-stream_loop", "-1",
+            "-t", str(clip_length),
+            "-an",
             "-i", animation_video,
             # Background video - seek to specific segment
-            "-ss", str(bg_start_time),
+            *bg_hwaccel,
+            *thread_args["input"],
             "-t", str(clip_length),
+            "-an",
+        ]
+        
+        suffix = [
             "-i", background_video,
-            # Music - seek to user-specified start time
+            # Music - seek to user-specified start time; cover art is skipped
             "-ss", str(music_start),
             "-t", str(clip_length),
+            "-vn",
             "-i", music_file,
             # Filter complex: process animation and background, then overlay
             "-filter_complex",
-            (
-                f"[0:v]trim=duration={clip_length},setpts=PTS-STARTPTS,format=rgba[main];"
-                f"[1:v]trim=duration={clip_length},setpts=PTS-STARTPTS,"
-                f"crop=ih*9/16:ih,scale=1080:1920[bg];"
-                "[bg][main]overlay=(W-w)/2:(H-h)/2:shortest=1[v]"
-            ),
+            filter_graph,
             "-map", "[v]",
             "-map", "2:a",  # Audio from music (input index 2)
             "-t", str(clip_length),
-            "-c:v", codec,
-            "-b:v", "3500k",
-            "-pix_fmt", "yuv420p",
+            *FFmpegRenderer.build_video_codec_args(codec, hw_filters, preset),
+            *thread_args["output"],
         ]
         
         # Audio processing
         if use_loudnorm:
-            cmd += ["-af", "loudnorm=I=-16:LRA=11:TP=-1.5"]
-        cmd += ["-c:a", "aac", "-b:a", "192k"]
+            suffix += ["-af", LOUDNORM_FILTER]
+        suffix += FFmpegRenderer.build_audio_codec_args(preset)
+        
+        # Clips are short, so moving the moov atom to the front is cheap
+        suffix += ["-movflags", "+faststart"]
+        
+        return prefix, suffix
+    
+    @staticmethod
+    def render_clip(
+        segment_index,
+        clip_length,
+        animation_video,
+        background_video,
+        music_file,
+        music_start,
+        output_path,
+        codec="libx264",
+        use_loudnorm=False,
+        log_dir=None,
+        hw_filters=False,
+        threads=0,
+        preset="speed",
+        bg_decode_args=None,
+        bg_size=None
+    ):
+        """
+        Render a single video clip
         
-        cmd.append(output_path)
+        Args:
+            segment_index: Index of the segment
+            clip_length: Length of clip in seconds
+            animation_video: Path to animation/overlay video
+            background_video: Path to background video
+            music_file: Path to music file
+            music_start: Start time in music file
+            output_path: Output file path
+            codec: Video codec to use
+            use_loudnorm: Whether to apply audio normalization
+            log_dir: Directory for log files
+            hw_filters: Run decode, scale and overlay on the GPU (NVENC only)
+            threads: FFmpeg thread count per stage (0 lets FFmpeg decide)
+            preset: Encoder preset key ('speed' or 'quality')
+            bg_decode_args: GPU decoder arguments for the background
+            bg_size: (width, height) of the background, if known
+            
+        Returns:
+            tuple: (success: bool, message: str)
+        """
+        command = FFmpegRenderer.build_clip_command(
+            clip_length, animation_video, background_video, music_file,
+            music_start, codec, use_loudnorm, hw_filters, threads, preset,
+            bg_decode_args, bg_size
+        )
+        return FFmpegRenderer.render_clip_command(
+            command, segment_index, clip_length, output_path, log_dir
+        )
+    
+    @staticmethod
+    def render_clip_command(
+        command, segment_index, clip_length, output_path, log_dir=None,
+        progress_callback=None
+    ):
+        """
+        Render a single video clip from a prebuilt session command
+        
+        Args:
+            command: (prefix, suffix) from build_clip_command()
+            segment_index: Index of the segment
+            clip_length: Length of clip in seconds
+            output_path: Output file path
+            log_dir: Directory for log files
+            progress_callback: Optional callable receiving the encoded
+                               seconds of this clip as FFmpeg reports them
+            
+        Returns:
+            tuple: (success: bool, message: str)
+        """
+        prefix, suffix = command
+        bg_start_time = segment_index * clip_length
+        cmd = [
+            FFMPEG_PATH, *prefix, "-ss", str(bg_start_time), *suffix, output_path
+        ]
         
         # Logging
         clip_name = os.path.basename(output_path)
@@ -144,45 +583,20 @@ class FFmpegRenderer:
             log_path = os.path.join(log_dir, f"{clip_name}.log")
         
         try:
-            if log_path:
-                with open(log_path, "w", encoding="utf-8") as logf:
-                    logf.write("COMMAND:\n" + " ".join(cmd) + "\n\n")
-                    logf.write(f"Started: {datetime.now()}\n\n")
-                    
-                    proc = subprocess.run(
-                        cmd,
-                        stdout=subprocess.PIPE,
-                        stderr=subprocess.STDOUT,
-                        text=True,
-                        timeout=clip_length * 20  # Generous timeout
-                    )
-                    
-                    logf.write(proc.stdout)
-                    logf.write(f"\n\nFinished: {datetime.now()}\n")
-                    logf.write(f"Return code: {proc.returncode}\n")
-                    
-                    if proc.returncode != 0:
-                        tail = "\n".join(proc.stdout.splitlines()[-20:])
-                        logger.error(f"Failed to render {clip_name}")
-                        return (False, f"❌ {clip_name} (see log: {log_path})")
-                    
-                    logger.info(f"Successfully rendered: {clip_name}")
-                    return (True, f"✅ {clip_name}")
-            else:
-                # No logging
-                proc = subprocess.run(
-                    cmd,
-                    stdout=subprocess.DEVNULL,
-                    stderr=subprocess.DEVNULL,
-                    timeout=clip_length * 20
-                )
-                
-                if proc.returncode != 0:
-                    logger.error(f"Failed to render {clip_name}")
-                    return (False, f"❌ {clip_name}")
-                
-                logger.info(f"Successfully rendered: {clip_name}")
-                return (True, f"✅ {clip_name}")
+            returncode = FFmpegRenderer._run_ffmpeg(
+                cmd, log_path,
+                timeout=clip_length * 20,  # Generous timeout
+                progress_callback=progress_callback,
+            )
+            
+            if returncode != 0:
+                logger.error(f"Failed to render {clip_name}")
+                if log_path:
+                    return (False, f"❌ {clip_name} (see log: {log_path})")
+                return (False, f"❌ {clip_name}")
+            
+            logger.info(f"Successfully rendered: {clip_name}")
+            return (True, f"✅ {clip_name}")
                 
         except subprocess.TimeoutExpired:
             logger.error(f"Timeout rendering {clip_name}")
@@ -190,6 +604,457 @@ class FFmpegRenderer:
         except Exception as e:
             logger.error(f"Exception rendering {clip_name}: {e}")
             return (False, f"❌ {clip_name} (error: {e})")
+    
+    @staticmethod
+    def render_batch(
+        num_clips,
+        clip_length,
+        animation_video,
+        background_video,
+        music_file,
+        music_start,
+        output_pattern,
+        codec="libx264",
+        use_loudnorm=False,
+        log_dir=None,
+        hw_filters=False,
+        first_index=0,
+        threads=0,
+        preset="speed",
+        bg_decode_args=None,
+        bg_size=None,
+        progress_callback=None
+    ):
+        """
+        Render a run of consecutive clips with a single FFmpeg process
+        
+        The background is decoded once and the output is split into clips
+        by the segment muxer. The animation and music segment restart for
+        every clip via concat-demuxer playlists.
+        
+        Args:
+            num_clips: Number of clips in this batch
+            clip_length: Length of each clip in seconds
+            animation_video: Path to animation/overlay video
+            background_video: Path to background video
+            music_file: Path to music file
+            music_start: Start time in music file
+            output_pattern: Output path with a %03d clip number placeholder
+            codec: Video codec to use
+            use_loudnorm: Whether to apply audio normalization
+            log_dir: Directory for log files
+            hw_filters: Run decode, scale and overlay on the GPU (NVENC only)
+            first_index: Index of the first clip in this batch
+            threads: FFmpeg thread count per stage (0 lets FFmpeg decide)
+            preset: Encoder preset key ('speed' or 'quality')
+            bg_decode_args: GPU decoder arguments for the background
+            bg_size: (width, height) of the background, if known
+            progress_callback: Optional callable receiving seconds encoded
+                               so far, called from the rendering thread
+            
+        Returns:
+            list: (success: bool, message: str) tuple per clip
+        """
+        total_length = num_clips * clip_length
+        bg_hwaccel, filter_graph = FFmpegRenderer.select_video_pipeline(
+            hw_filters, bg_decode_args, bg_size
+        )
+        thread_args = FFmpegRenderer.build_thread_args(threads)
+        work_dir = log_dir or os.path.dirname(output_pattern).replace("%%", "%")
+        batch_name = f"batch_{first_index + 1:03d}"
+        
+        anim_list = os.path.join(work_dir, f"{batch_name}_animation.txt")
+        music_list = os.path.join(work_dir, f"{batch_name}_music.txt")
+        
+        cmd = [
+            FFMPEG_PATH,
+            "-y",
+            *thread_args["global"],
+            *(CUDA_DEVICE_ARGS if hw_filters else []),
+            # Animation restarted for every clip
+            "-f", "concat", "-safe", "0",
+            "-an",
+            "-i", anim_list,
+            # Background covering all segments, decoded once
+            *bg_hwaccel,
+            *thread_args["input"],
+            "-ss", str(first_index * clip_length),
+            "-t", str(total_length),
+            "-an",
+            "-i", background_video,
+            # Music segment repeated for every clip
+            "-f", "concat", "-safe", "0",
+            "-vn",
+            "-i", music_list,
+            "-filter_complex",
+            filter_graph,
+            "-map", "[v]",
+            "-map", "2:a",
+            "-t", str(total_length),
+            *FFmpegRenderer.build_video_codec_args(codec, hw_filters, preset),
+            *thread_args["output"],
+            # Keyframe at every clip boundary so segments split exactly
+            "-force_key_frames", f"expr:gte(t,n_forced*{clip_length})",
+        ]
+        if codec == "h264_nvenc":
+            # NVENC only flags IDR frames as keyframes for the muxer
+            cmd += ["-forced-idr", "1"]
+        
+        if use_loudnorm:
+            cmd += ["-af", LOUDNORM_FILTER]
+        cmd += FFmpegRenderer.build_audio_codec_args(preset)
+        
+        cmd += [
+            "-f", "segment",
+            "-segment_time", str(clip_length),
+            # Tolerate timestamp rounding so cuts land on the forced keyframes
+            "-segment_time_delta", "0.05",
+            "-segment_format", "mp4",
+            "-segment_format_options", "movflags=+faststart",
+            "-segment_start_number", str(first_index + 1),
+            "-reset_timestamps", "1",
+            output_pattern,
+        ]
+        
+        logger.info(f"Starting {batch_name} ({num_clips} clips)")
+        
+        log_path = None
+        if log_dir:
+            log_path = os.path.join(log_dir, f"{batch_name}.log")
+        
+        try:
+            FFmpegRenderer._write_concat_list(
+                anim_list, animation_video, num_clips, 0, clip_length
+            )
+            FFmpegRenderer._write_concat_list(
+                music_list, music_file, num_clips, music_start, clip_length
+            )
+            returncode = FFmpegRenderer._run_ffmpeg(
+                cmd, log_path, timeout=total_length * 20,
+                progress_callback=progress_callback
+            )
+            error = None if returncode == 0 else f"see log: {log_path}"
+        except subprocess.TimeoutExpired:
+            logger.error(f"Timeout rendering {batch_name}")
+            error = "timeout"
+        except Exception as e:
+            logger.error(f"Exception rendering {batch_name}: {e}")
+            error = f"error: {e}"
+        
+        results = []
+        for i in range(first_index, first_index + num_clips):
+            clip_path = output_pattern % (i + 1)
+            clip_name = os.path.basename(clip_path)
+            if error is None and os.path.isfile(clip_path):
+                results.append((True, f"✅ {clip_name}"))
+            else:
+                results.append((False, f"❌ {clip_name} ({error or 'missing'})"))
+        
+        logger.info(f"Finished {batch_name}")
+        return results
+    
+    @staticmethod
+    def create_seek_proxy(background_video, output_path, duration, log_dir=None):
+        """
+        Transcode the used part of the background to an all-intra proxy
+        
+        Every frame of the proxy is a keyframe, so each clip's -ss lands
+        directly on its first frame instead of decoding from the previous
+        keyframe of a long-GOP source. The 9:16 crop and scale are baked in,
+        which makes the render graph's own crop/scale a no-op.
+        
+        Args:
+            background_video: Path to background video
+            output_path: Proxy file path
+            duration: Length of background to transcode, from the start
+            log_dir: Directory for log files
+            
+        Returns:
+            bool: True if the proxy was created
+        """
+        cmd = [
+            FFMPEG_PATH, "-y",
+            "-t", str(duration),
+            "-i", background_video,
+            "-an",
+            "-vf", f"crop=ih*9/16:ih,scale={OUTPUT_WIDTH}:{OUTPUT_HEIGHT}",
+            "-c:v", "libx264",
+            "-preset", "ultrafast",
+            "-g", "1",
+            "-crf", "18",
+            "-pix_fmt", "yuv420p",
+            output_path
+        ]
+        log_path = os.path.join(log_dir, "seek_proxy.log") if log_dir else None
+        
+        logger.info(f"Creating seek proxy ({duration}s)")
+        try:
+            returncode = FFmpegRenderer._run_ffmpeg(
+                cmd, log_path, timeout=max(60, duration * 5)
+            )
+        except Exception as e:
+            logger.error(f"Exception creating seek proxy: {e}")
+            return False
+        
+        if returncode != 0:
+            logger.warning("Seek proxy failed, rendering from the original background")
+            return False
+        return True
+    
+    @staticmethod
+    def measure_loudness(music_file, music_start, clip_length):
+        """
+        Measure a music segment with loudnorm's analysis pass
+        
+        Results are cached per segment and by (path, mtime, size), so
+        re-rendering with the same music settings skips the analysis while
+        a file replaced in place is measured again.
+        
+        Args:
+            music_file: Path to music file
+            music_start: Start time in music (seconds)
+            clip_length: Length of the segment (seconds)
+            
+        Returns:
+            tuple: (input_i, input_lra, input_tp, input_thresh, target_offset),
+                   or None if the measurement failed
+        """
+        try:
+            st = os.stat(music_file)
+        except OSError as e:
+            logger.error(f"Exception measuring loudness: {e}")
+            return None
+        return FFmpegRenderer._measure_loudness(
+            music_file, st.st_mtime_ns, st.st_size, music_start, clip_length
+        )
+    
+    @staticmethod
+    @lru_cache(maxsize=32)
+    def _measure_loudness(music_file, mtime_ns, size, music_start, clip_length):
+        """
+        Run loudnorm's analysis pass over a music segment
+        
+        Args:
+            music_file: Path to music file
+            mtime_ns: Modification time of the file in nanoseconds
+            size: Size of the file in bytes
+            music_start: Start time in music (seconds)
+            clip_length: Length of the segment (seconds)
+            
+        Returns:
+            tuple: Loudness measurements (see measure_loudness), or None
+        """
+        cmd = [
+            FFMPEG_PATH, "-hide_banner", "-nostats",
+            "-ss", str(music_start),
+            "-t", str(clip_length),
+            "-i", music_file,
+            "-vn",
+            "-af", f"{LOUDNORM_FILTER}:print_format=json",
+            "-f", "null", "-"
+        ]
+        try:
+            result = subprocess.run(
+                cmd,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.PIPE,
+                text=True,
+                errors="replace",
+                timeout=max(60, clip_length * 2)
+            )
+            marker = result.stderr.rfind(LOUDNORM_MARKER)
+            reports = LOUDNORM_REPORT.findall(result.stderr, max(marker, 0))
+            if result.returncode != 0 or marker < 0 or not reports:
+                return None
+            data = json.loads(reports[-1])
+            return tuple(
+                float(data[key]) for key in (
+                    "input_i", "input_lra", "input_tp", "input_thresh", "target_offset"
+                )
+            )
+        except Exception as e:
+            logger.error(f"Exception measuring loudness: {e}")
+            return None
+    
+    @staticmethod
+    def normalize_music_segment(music_file, music_start, clip_length, output_path, log_dir=None):
+        """
+        Write the loudness-normalized music segment to a WAV file
+        
+        Every clip uses the same music segment, so it is normalized once
+        here (two-pass, linear gain) instead of running loudnorm in every
+        clip's FFmpeg process.
+        
+        Args:
+            music_file: Path to music file
+            music_start: Start time in music (seconds)
+            clip_length: Length of the segment (seconds)
+            output_path: WAV file path
+            log_dir: Directory for log files
+            
+        Returns:
+            bool: True if the segment was written
+        """
+        measured = FFmpegRenderer.measure_loudness(music_file, music_start, clip_length)
+        if measured is None:
+            logger.warning("Loudness measurement failed, normalizing per clip")
+            return False
+        
+        i, lra, tp, thresh, offset = measured
+        cmd = [
+            FFMPEG_PATH, "-y",
+            "-ss", str(music_start),
+            "-t", str(clip_length),
+            "-i", music_file,
+            "-vn",
+            "-af", (
+                f"{LOUDNORM_FILTER}:measured_I={i}:measured_LRA={lra}"
+                f":measured_TP={tp}:measured_thresh={thresh}:offset={offset}"
+                ":linear=true"
+            ),
+            # loudnorm resamples to 192 kHz internally
+            "-ar", "48000",
+            "-c:a", "pcm_s16le",
+            output_path
+        ]
+        log_path = os.path.join(log_dir, "normalize_music.log") if log_dir else None
+        
+        try:
+            returncode = FFmpegRenderer._run_ffmpeg(
+                cmd, log_path, timeout=max(60, clip_length * 2)
+            )
+        except Exception as e:
+            logger.error(f"Exception normalizing music: {e}")
+            return False
+        
+        if returncode != 0:
+            logger.warning("Music normalization failed, normalizing per clip")
+            return False
+        return True
+    
+    @staticmethod
+    def _write_concat_list(list_path, media_file, count, start, length):
+        """
+        Write a concat-demuxer playlist repeating one media segment
+        
+        Args:
+            list_path: Playlist file to write
+            media_file: Media file to repeat
+            count: Number of repetitions
+            start: Segment start time in seconds
+            length: Segment length in seconds
+        """
+        escaped = os.path.abspath(media_file).replace("'", "'\\''")
+        entry = (
+            f"file '{escaped}'\n"
+            f"inpoint {start}\n"
+            f"outpoint {start + length}\n"
+        )
+        with open(list_path, "w", encoding="utf-8") as f:
+            f.write("ffconcat version 1.0\n" + entry * count)
+    
+    @staticmethod
+    def _run_ffmpeg(cmd, log_path, timeout, progress_callback=None):
+        """
+        Run an FFmpeg command, capturing its output to a log file if given
+        
+        Args:
+            cmd: FFmpeg command as a list of arguments
+            log_path: Log file path, or None to keep only the error tail
+            timeout: Timeout in seconds
+            progress_callback: Optional callable receiving the encoded output
+                               time in seconds as FFmpeg reports it
+            
+        Returns:
+            int: FFmpeg return code
+        """
+        if progress_callback:
+            # Machine-readable progress on stdout replaces the stats line
+            cmd = [cmd[0], "-progress", "pipe:1", "-nostats", *cmd[1:]]
+        
+        # FFmpeg's log goes straight into the log file descriptor; Python
+        # only reads the progress pipe. Without a log file, only the last
+        # stderr lines are kept in memory for error reporting; progress
+        # lines never reach them. Output stays bytes and is decoded only
+        # on failure.
+        tail = deque(maxlen=20)
+        logf = open(log_path, "wb") if log_path else None
+        try:
+            if logf:
+                logf.write(
+                    f"COMMAND:\n{' '.join(cmd)}\n\nStarted: {datetime.now()}\n\n"
+                    .encode("utf-8")
+                )
+                logf.flush()
+                stdout = subprocess.PIPE if progress_callback else logf
+                stderr = logf
+            else:
+                stdout = subprocess.PIPE if progress_callback else subprocess.DEVNULL
+                stderr = subprocess.PIPE
+            
+            # A timer enforces the timeout while the pipe is read
+            with subprocess.Popen(cmd, stdout=stdout, stderr=stderr) as proc:
+                timer = threading.Timer(timeout, proc.kill)
+                timer.start()
+                reader = None
+                try:
+                    if proc.stderr and proc.stdout:
+                        # Both pipes are open: drain stderr alongside progress
+                        reader = threading.Thread(
+                            target=tail.extend, args=(proc.stderr,), daemon=True
+                        )
+                        reader.start()
+                    elif proc.stderr:
+                        tail.extend(proc.stderr)
+                    for line in proc.stdout or ():
+                        if line.startswith(b"out_time_us="):
+                            value = line[12:].strip()
+                            if value.isdigit():
+                                progress_callback(int(value) / 1_000_000)
+                    returncode = proc.wait()
+                    if reader:
+                        reader.join()
+                finally:
+                    timed_out = not timer.is_alive()
+                    timer.cancel()
+            
+            if logf:
+                logf.write(
+                    f"\n\nFinished: {datetime.now()}\nReturn code: {returncode}\n"
+                    .encode("utf-8")
+                )
+        finally:
+            if logf:
+                logf.close()
+        
+        if timed_out:
+            raise subprocess.TimeoutExpired(cmd, timeout)
+        if returncode != 0:
+            if logf:
+                tail = [FFmpegRenderer._read_log_tail(log_path)]
+            output = b"".join(tail).decode("utf-8", errors="replace")
+            logger.error("FFmpeg output tail:\n" + output.rstrip())
+        return returncode
+    
+    @staticmethod
+    def _read_log_tail(log_path, size=4096):
+        """
+        Read the end of a log file
+        
+        Args:
+            log_path: Log file path
+            size: Maximum number of bytes to read
+            
+        Returns:
+            bytes: Last bytes of the file, or b"" if unreadable
+        """
+        try:
+            with open(log_path, "rb") as f:
+                f.seek(0, os.SEEK_END)
+                f.seek(max(0, f.tell() - size))
+                return f.read()
+        except OSError:
+            return b""
 
 
 class RenderSession:
@@ -205,9 +1070,13 @@ class RenderSession:
         self.session_name = datetime.now().strftime("session_%Y%m%d_%H%M%S")
         self.session_dir = os.path.join(output_base_dir, self.session_name)
         self.log_dir = os.path.join(self.session_dir, "logs")
+        self.success_count = 0
+        self.result_count = 0
+        self._summary_file = None
+        self._next_flush = 0
+        self._clip_patterns = {}
         
-        # Create directories
-        os.makedirs(self.session_dir, exist_ok=True)
+        # Creating the logs folder creates the session folder with it
         os.makedirs(self.log_dir, exist_ok=True)
         
         logger.info(f"Created session: {self.session_dir}")
@@ -223,45 +1092,115 @@ class RenderSession:
         Returns:
             str: Full path to output file
         """
-        filename = f"clip_{index + 1:03d}_{clip_length}s.mp4"
-        return os.path.join(self.session_dir, filename)
+        return self.generate_clip_pattern(clip_length) % (index + 1)
     
-    def write_summary(self, settings, results):
+    def generate_clip_pattern(self, clip_length):
         """
-        Write session summary file
+        Generate a numbered output pattern for the segment muxer
+        
+        Args:
+            clip_length: Clip length in seconds
+            
+        Returns:
+            str: Full path pattern with a %03d clip number placeholder
+                 (any % in the folder is escaped as %%)
+        """
+        pattern = self._clip_patterns.get(clip_length)
+        if pattern is None:
+            filename = f"clip_%03d_{clip_length}s.mp4"
+            # A literal % in the folder must not act as a placeholder
+            pattern = os.path.join(self.session_dir.replace("%", "%%"), filename)
+            self._clip_patterns[clip_length] = pattern
+        return pattern
+    
+    def start_summary(self, settings):
+        """
+        Open the session summary file and write its header
+        
+        Results are appended as they arrive and flushed at most once per
+        SUMMARY_FLUSH_INTERVAL, so the summary survives an interrupted session.
         
         Args:
             settings: Dictionary of rendering settings
-            results: List of result messages
         """
         summary_path = os.path.join(self.session_dir, "summary.txt")
+        self.success_count = 0
+        self.result_count = 0
         
         try:
-            with open(summary_path, "w", encoding="utf-8") as f:
-                f.write(f"AutoCutter Render Session\n")
-                f.write(f"=" * 50 + "\n\n")
-                f.write(f"Session: {self.session_name}\n")
-                f.write(f"Date: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n")
-                
-                f.write("Settings:\n")
-                f.write("-" * 50 + "\n")
-                for key, value in settings.items():
-                    if isinstance(value, str) and os.path.exists(value):
-                        value = os.path.basename(value)
-                    f.write(f"{key}: {value}\n")
-                
-                f.write("\n" + "=" * 50 + "\n")
-                f.write("Results:\n")
-                f.write("-" * 50 + "\n")
-                
-                success_count = sum(1 for r in results if r.startswith("✅"))
-                total = len(results)
-                f.write(f"\nSuccess: {success_count}/{total}\n\n")
-                
-                for r in results:
-                    f.write(r + "\n")
+            lines = [
+                "AutoCutter Render Session",
+                "=" * 50,
+                "",
+                f"Session: {self.session_name}",
+                f"Date: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}",
+                "",
+                "Settings:",
+                "-" * 50,
+            ]
+            for key, value in settings.items():
+                if key in SUMMARY_PATH_KEYS and value:
+                    value = os.path.basename(os.path.normpath(value))
+                lines.append(f"{key}: {value}")
+            lines += ["", "=" * 50, "Results:", "-" * 50, "", ""]
             
-            logger.info(f"Summary written to: {summary_path}")
+            f = open(summary_path, "w", encoding="utf-8")
+            f.write("\n".join(lines))
+            f.flush()
+            self._next_flush = time.monotonic() + SUMMARY_FLUSH_INTERVAL
+            self._summary_file = f
             
         except Exception as e:
-            logger.error(f"Error writing summary: {e}")
\ No newline at end of file
+            logger.error(f"Error writing summary: {e}")
+            self._summary_file = None
+    
+    def record_result(self, success, message):
+        """
+        Append one result line to the summary file
+        
+        Args:
+            success: Whether the clip rendered
+            message: Result message
+        """
+        self.result_count += 1
+        self.success_count += success
+        
+        if self._summary_file:
+            try:
+                self._summary_file.write(message + "\n")
+                # Buffered between flushes; bursts of results cost one write
+                now = time.monotonic()
+                if now >= self._next_flush:
+                    self._summary_file.flush()
+                    self._next_flush = now + SUMMARY_FLUSH_INTERVAL
+            except Exception as e:
+                logger.error(f"Error writing summary: {e}")
+    
+    def finish_summary(self):
+        """Write the success count and close the summary file"""
+        if not self._summary_file:
+            return
+        
+        try:
+            self._summary_file.write(
+                f"\nSuccess: {self.success_count}/{self.result_count}\n"
+            )
+            self._summary_file.close()
+            logger.info(f"Summary written to: {self._summary_file.name}")
+        except Exception as e:
+            logger.error(f"Error writing summary: {e}")
+        finally:
+            self._summary_file = None
+    
+    def write_summary(self, settings, results):
+        """
+        Write session summary file
+        
+        Args:
+            settings: Dictionary of rendering settings
+            results: List of (success: bool, message: str) tuples
+        """
+        self.start_summary(settings)
+        for success, message in results:
+            self.record_result(success, message)
+        self.finish_summary()